@@ -0,0 +1,34 @@
+"""
+Timestamp Helpers
+
+Format local timestamps straight from time.time() without building
+datetime objects.
+"""
+
+import time
+
+
+def now_iso() -> str:
+    """
+    Get current local time in ISO 8601 format.
+
+    Returns:
+        Timestamp like '2024-01-31T14:05:09.123456'
+    """
+    t = time.time()
+    lt = time.localtime(t)
+    us = int((t % 1) * 1e6)
+    return (f"{lt.tm_year:04d}-{lt.tm_mon:02d}-{lt.tm_mday:02d}"
+            f"T{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}.{us:06d}")
+
+
+def now_stamp() -> str:
+    """
+    Get current local time as a compact file-name stamp.
+
+    Returns:
+        Timestamp like '20240131_140509'
+    """
+    lt = time.localtime()
+    return (f"{lt.tm_year:04d}{lt.tm_mon:02d}{lt.tm_mday:02d}"
+            f"_{lt.tm_hour:02d}{lt.tm_min:02d}{lt.tm_sec:02d}")
@@ -0,0 +1,92 @@
+"""
+JSON Helpers
+
+Fast JSON encoding/decoding using orjson when available,
+falling back to the standard library json module. ujson, if installed,
+is used for parsing small documents where its call overhead is lowest.
+
+JSON has no NaN/Infinity: both backends write non-finite floats as null,
+so such values load back as None.
+"""
+
+import json
+import math
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import ujson
+    HAS_UJSON = True
+except ImportError:
+    HAS_UJSON = False
+
+# Documents smaller than this are parsed with ujson when available
+SMALL_DOCUMENT_BYTES = 8192
+
+
+def _finite(obj):
+    """Copy obj with non-finite floats replaced by None, as orjson writes them."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+def dumps(obj, indent: int = 2) -> bytes:
+    """
+    Serialize object to UTF-8 encoded JSON.
+
+    Args:
+        obj: Object to serialize
+        indent: Indentation level (orjson only supports 2 or None)
+
+    Returns:
+        JSON document as bytes (NaN/Infinity written as null)
+    """
+    if HAS_ORJSON and indent in (2, None):
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    return json.dumps(_finite(obj), indent=indent, allow_nan=False).encode('utf-8')
+
+
+def loads(data):
+    """
+    Deserialize JSON document.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Deserialized object
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN tokens in files written by the json module; retry below
+    return json.loads(data)
+
+
+def loads_small(data):
+    """
+    Deserialize a JSON document that is usually small (e.g. session.json).
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Deserialized object
+    """
+    if HAS_UJSON and len(data) < SMALL_DOCUMENT_BYTES:
+        return ujson.loads(data)
+    return loads(data)
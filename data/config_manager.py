@@ -4,10 +4,28 @@ Configuration Manager
 Handles saving and loading of system configuration.
 """
 
-import json
+import os
+import threading
 from pathlib import Path
 from typing import Dict, Optional
-from datetime import datetime
+
+from . import _json
+from ._clock import now_iso
+
+
+def _fsync_path(path: Path):
+    """Flush a file and its parent directory entry to disk, ignoring unsupported targets."""
+    for target in (path, path.parent):
+        try:
+            fd = os.open(target, os.O_RDONLY)
+        except OSError:
+            continue  # e.g. directories cannot be opened on Windows
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
 
 
 class ConfigManager:
@@ -23,6 +41,15 @@ class ConfigManager:
         self.config_file = config_file
         self.config = self._load_default_config()
 
+        # Index of key path tuple -> section dict for get(); leaves are read
+        # from their live parent so in-place edits are never stale
+        self._sections: Dict[tuple, Dict] = {}
+        self._rebuild_index()
+
+        # Background fsync after save(); pending requests collapse into one
+        self._sync_pending = threading.Event()
+        self._sync_thread: Optional[threading.Thread] = None
+
         # Load existing config if available
         if self.config_file.exists():
             self.load()
@@ -88,7 +115,7 @@ class ConfigManager:
                 'deceleration': 1000,
                 'jerk_limit': 5000
             },
-            'last_modified': datetime.now().isoformat()
+            'last_modified': now_iso()
         }
 
     def load(self) -> bool:
@@ -99,11 +126,11 @@ class ConfigManager:
             True if successful
         """
         try:
-            with open(self.config_file, 'r') as f:
-                loaded_config = json.load(f)
+            loaded_config = _json.loads(Path(self.config_file).read_bytes())
 
             # Merge with defaults (in case new keys were added)
             self._merge_config(self.config, loaded_config)
+            self._rebuild_index()
 
             return True
         except Exception as e:
@@ -112,19 +139,69 @@ class ConfigManager:
 
     def save(self):
         """Save configuration to file."""
-        self.config['last_modified'] = datetime.now().isoformat()
+        self.config['last_modified'] = now_iso()
+
+        # Write a sibling temp file and swap it in atomically, so a crash
+        # never leaves a truncated config behind
+        config_file = Path(self.config_file)
+        tmp_file = config_file.with_name(config_file.name + '.tmp')
+        tmp_file.write_bytes(_json.dumps(self.config))
+        os.replace(tmp_file, config_file)
+
+        self._request_sync()
 
-        with open(self.config_file, 'w') as f:
-            json.dump(self.config, f, indent=2)
+    def _request_sync(self):
+        """Schedule a background fsync of the config file."""
+        self._sync_pending.set()
+        if self._sync_thread is None:
+            self._sync_thread = threading.Thread(target=self._sync_loop, daemon=True)
+            self._sync_thread.start()
+
+    def _sync_loop(self):
+        """Sync thread: fsync the config file whenever a save is pending."""
+        while True:
+            self._sync_pending.wait()
+            self._sync_pending.clear()
+            _fsync_path(Path(self.config_file))
 
     def _merge_config(self, default: Dict, loaded: Dict):
         """Recursively merge loaded config into default config."""
         for key, value in loaded.items():
-            if key in default and isinstance(default[key], dict) and isinstance(value, dict):
-                self._merge_config(default[key], value)
+            existing = default.get(key)
+
+            # Unchanged values and subtrees need no merge
+            if key in default and (existing is value or existing == value):
+                continue
+
+            if isinstance(existing, dict) and isinstance(value, dict):
+                self._merge_config(existing, value)
             else:
                 default[key] = value
 
+    def _rebuild_index(self):
+        """Rebuild the section index from the nested config."""
+        self._sections = {(): self.config}
+        self._index_sections(self.config)
+
+    def _index_sections(self, d: Dict, prefix: tuple = ()):
+        """Index every dict nested in d under its key path."""
+        for key, value in d.items():
+            if isinstance(value, dict):
+                path = prefix + (key,)
+                self._sections[path] = value
+                self._index_sections(value, path)
+
+    def _reindex(self, keys: tuple):
+        """Refresh index entries for the value stored at a key path."""
+        depth = len(keys)
+        for path in [p for p in self._sections if len(p) >= depth and p[:depth] == keys]:
+            del self._sections[path]
+
+        value = self._lookup(*keys)
+        if isinstance(value, dict):
+            self._sections[keys] = value
+            self._index_sections(value, keys)
+
     def get(self, *keys) -> Optional:
         """
         Get configuration value by key path.
@@ -133,8 +210,20 @@ class ConfigManager:
             *keys: Key path (e.g., 'hardware', 'teensy', 'port')
 
         Returns:
-            Configuration value or None
+            Configuration value or None. Sections are returned live;
+            replace whole sections through set() to keep the index current.
         """
+        if not keys:
+            return self.config
+
+        parent = self._sections.get(keys[:-1])
+        if parent is None:
+            # Section added by editing a returned dict in place
+            return self._lookup(*keys)
+        return parent.get(keys[-1])
+
+    def _lookup(self, *keys) -> Optional:
+        """Get configuration value by walking the nested config."""
         value = self.config
         for key in keys:
             if isinstance(value, dict) and key in value:
@@ -152,12 +241,14 @@ class ConfigManager:
             value: Value to set
         """
         config = self.config
-        for key in keys[:-1]:
+        for i, key in enumerate(keys[:-1]):
             if key not in config:
                 config[key] = {}
+                self._sections[keys[:i + 1]] = config[key]
             config = config[key]
 
         config[keys[-1]] = value
+        self._reindex(keys)
 
     def get_safety_limits(self) -> Dict:
         """Get safety limits configuration."""
@@ -166,6 +257,7 @@ class ConfigManager:
     def set_safety_limits(self, limits: Dict):
         """Set safety limits configuration."""
         self.config['safety_limits'].update(limits)
+        self._reindex(('safety_limits',))
 
     def get_pid_params(self) -> Dict:
         """Get PID parameters."""
@@ -174,6 +266,7 @@ class ConfigManager:
     def set_pid_params(self, params: Dict):
         """Set PID parameters."""
         self.config['pid'].update(params)
+        self._reindex(('pid',))
 
     def get_motion_profile(self) -> Dict:
         """Get motion profile."""
@@ -182,7 +275,9 @@ class ConfigManager:
     def set_motion_profile(self, profile: Dict):
         """Set motion profile."""
         self.config['motion_profile'].update(profile)
+        self._reindex(('motion_profile',))
 
     def reset_to_defaults(self):
         """Reset configuration to defaults."""
         self.config = self._load_default_config()
+        self._rebuild_index()
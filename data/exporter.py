@@ -5,10 +5,46 @@ Provides functions for exporting test data in various formats.
 """
 
 import csv
+import io
 import json
+import os
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional
-import numpy as np
+
+from . import _json
+
+# Rows formatted in memory per write() call in export_csv
+CSV_CHUNK_ROWS = 10000
+
+# "# Key: value" metadata comment lines at the top of exported CSV files
+_CSV_METADATA_RE = re.compile(r'^#+\s*([^:]+):\s*(.*)$')
+
+# Parallel file copies in BatchExporter
+COPY_WORKERS = 8
+
+
+def _copy_file(src: Path, dst: Path):
+    """Copy file contents in kernel space and preserve access/modify times."""
+    # copyfile uses sendfile()/fcopyfile() where the OS supports it
+    shutil.copyfile(src, dst)
+    st = os.stat(src)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _copy_files(pairs: List[tuple]):
+    """Copy (src, dst) file pairs concurrently, skipping missing sources."""
+    pairs = [(src, dst) for src, dst in pairs if src.exists()]
+    if len(pairs) <= 1:
+        for src, dst in pairs:
+            _copy_file(src, dst)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(COPY_WORKERS, len(pairs))) as executor:
+        # Consume results so copy errors propagate to the caller
+        list(executor.map(lambda pair: _copy_file(*pair), pairs))
 
 
 class DataExporter:
@@ -31,7 +67,7 @@ class DataExporter:
         filepath = Path(filepath)
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(filepath, 'w', newline='') as f:
+        with open(filepath, 'w', newline='', buffering=1 << 20) as f:
             # Write metadata as comments
             if metadata:
                 f.write(f"# Export Date: {metadata.get('export_date', 'Unknown')}\n")
@@ -44,10 +80,16 @@ class DataExporter:
 
                 f.write("#\n")
 
-            # Write CSV data
-            writer = csv.DictWriter(f, fieldnames=data[0].keys())
+            # Write CSV data, formatted in memory and written in chunks
+            buf = io.StringIO()
+            writer = csv.DictWriter(buf, fieldnames=data[0].keys())
             writer.writeheader()
-            writer.writerows(data)
+
+            for start in range(0, len(data), CSV_CHUNK_ROWS):
+                writer.writerows(data[start:start + CSV_CHUNK_ROWS])
+                f.write(buf.getvalue())
+                buf.seek(0)
+                buf.truncate(0)
 
         print(f"Exported {len(data)} rows to {filepath}")
 
@@ -64,8 +106,7 @@ class DataExporter:
         filepath = Path(filepath)
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=indent)
+        filepath.write_bytes(_json.dumps(data, indent=indent))
 
         print(f"Exported JSON to {filepath}")
 
@@ -102,50 +143,52 @@ class DataExporter:
         filepath = Path(filepath)
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
+        out = []
+        out.append("="*60 + "\n")
+        out.append("TEST BENCH SESSION REPORT\n")
+        out.append("="*60 + "\n\n")
+
+        # Session info
+        out.append(f"Session ID: {session_data.get('session_id', 'Unknown')}\n")
+        out.append(f"Created: {session_data.get('created', 'Unknown')}\n")
+        out.append(f"Platform: {session_data.get('platform', 'Unknown')}\n\n")
+
+        # Hardware info
+        if 'hardware' in session_data:
+            out.append("Hardware Configuration:\n")
+            out.extend(f"  {key}: {value}\n" for key, value in session_data['hardware'].items())
+            out.append("\n")
+
+        # Tests summary
+        tests = session_data.get('tests', [])
+        out.append(f"Total Tests: {len(tests)}\n\n")
+
+        for i, test in enumerate(tests, 1):
+            out.append(f"Test {i}: {test.get('test_type', 'Unknown')}\n")
+            out.append(f"  ID: {test.get('test_id', 'Unknown')}\n")
+            out.append(f"  Time: {test.get('timestamp', 'Unknown')}\n")
+            out.append(f"  Status: {test.get('status', 'Unknown')}\n")
+
+            # Test results if available
+            if 'results' in test:
+                out.append("  Results:\n")
+                out.extend(f"    {key}: {value}\n" for key, value in test['results'].items())
+
+            out.append("\n")
+
+        # Notes
+        if session_data.get('notes'):
+            out.append("Notes:\n")
+            out.append(session_data['notes'])
+            out.append("\n\n")
+
+        out.append("="*60 + "\n")
+        out.append("End of Report\n")
+        out.append("="*60 + "\n")
+
+        # Single write of the whole report
         with open(filepath, 'w') as f:
-            f.write("="*60 + "\n")
-            f.write("TEST BENCH SESSION REPORT\n")
-            f.write("="*60 + "\n\n")
-
-            # Session info
-            f.write(f"Session ID: {session_data.get('session_id', 'Unknown')}\n")
-            f.write(f"Created: {session_data.get('created', 'Unknown')}\n")
-            f.write(f"Platform: {session_data.get('platform', 'Unknown')}\n\n")
-
-            # Hardware info
-            if 'hardware' in session_data:
-                f.write("Hardware Configuration:\n")
-                for key, value in session_data['hardware'].items():
-                    f.write(f"  {key}: {value}\n")
-                f.write("\n")
-
-            # Tests summary
-            tests = session_data.get('tests', [])
-            f.write(f"Total Tests: {len(tests)}\n\n")
-
-            for i, test in enumerate(tests, 1):
-                f.write(f"Test {i}: {test.get('test_type', 'Unknown')}\n")
-                f.write(f"  ID: {test.get('test_id', 'Unknown')}\n")
-                f.write(f"  Time: {test.get('timestamp', 'Unknown')}\n")
-                f.write(f"  Status: {test.get('status', 'Unknown')}\n")
-
-                # Test results if available
-                if 'results' in test:
-                    f.write("  Results:\n")
-                    for key, value in test['results'].items():
-                        f.write(f"    {key}: {value}\n")
-
-                f.write("\n")
-
-            # Notes
-            if session_data.get('notes'):
-                f.write("Notes:\n")
-                f.write(session_data['notes'])
-                f.write("\n\n")
-
-            f.write("="*60 + "\n")
-            f.write("End of Report\n")
-            f.write("="*60 + "\n")
+            f.write(''.join(out))
 
         print(f"Exported summary report to {filepath}")
 
@@ -163,29 +206,24 @@ class DataExporter:
         filepath = Path(filepath)
         metadata = {}
         data = []
+        body = []
+        in_header = True
 
         with open(filepath, 'r') as f:
-            # Read metadata comments
+            # Single pass: parse leading metadata comments, skip all comments
             for line in f:
                 if line.startswith('#'):
-                    # Parse metadata
-                    line = line.lstrip('#').strip()
-                    if ':' in line:
-                        key, value = line.split(':', 1)
-                        metadata[key.strip()] = value.strip()
+                    if in_header:
+                        match = _CSV_METADATA_RE.match(line)
+                        if match:
+                            metadata[match.group(1).strip()] = match.group(2).strip()
                 else:
-                    break
-
-            # Reset to start of file
-            f.seek(0)
+                    in_header = False
+                    body.append(line)
 
-            # Skip comments
-            lines = [line for line in f if not line.startswith('#')]
-
-            # Read CSV
-            if lines:
-                reader = csv.DictReader(lines)
-                data = list(reader)
+        # Read CSV
+        if body:
+            data = list(csv.DictReader(body))
 
         return data, metadata
 
@@ -215,6 +253,9 @@ class BatchExporter:
 
         exporter = DataExporter()
 
+        # Persist any batched test additions before exporting
+        self.session.save_metadata()
+
         # Export session metadata
         if 'json' in formats:
             exporter.export_json(
@@ -231,15 +272,15 @@ class BatchExporter:
 
         # Copy data files
         if 'csv' in formats:
+            copies = []
             for test in self.session.metadata['tests']:
                 data_file = test.get('data_file')
                 if data_file:
                     src = self.session.session_dir / data_file
                     dst = output_dir / Path(data_file).name
+                    copies.append((src, dst))
 
-                    if src.exists():
-                        import shutil
-                        shutil.copy2(src, dst)
+            _copy_files(copies)
 
         print(f"Exported session to {output_dir}")
 
@@ -267,25 +308,23 @@ class BatchExporter:
             print(f"Test {test_id} not found in session")
             return
 
+        copies = []
+
         # Export test data
         data_file = test.get('data_file')
         if data_file:
             src = self.session.session_dir / data_file
             dst = output_dir / Path(data_file).name
-
-            if src.exists():
-                import shutil
-                shutil.copy2(src, dst)
+            copies.append((src, dst))
 
         # Export plots
         if include_plots:
             for plot_file in test.get('plot_files', []):
                 src = self.session.session_dir / plot_file
                 dst = output_dir / Path(plot_file).name
+                copies.append((src, dst))
 
-                if src.exists():
-                    import shutil
-                    shutil.copy2(src, dst)
+        _copy_files(copies)
 
         # Export test config
         exporter = DataExporter()
@@ -308,6 +347,9 @@ def create_analysis_summary(data: List[Dict], test_type: str) -> Dict:
     Returns:
         Summary statistics dict
     """
+    # Imported here so metadata-only users of this module skip the numpy import
+    import numpy as np
+
     if not data:
         return {}
 
@@ -317,25 +359,50 @@ def create_analysis_summary(data: List[Dict], test_type: str) -> Dict:
         'statistics': {}
     }
 
-    # Convert to numpy for analysis
-    numeric_fields = []
+    # Numeric columns are those whose first value parses as a float
+    numeric_keys = []
     for key in data[0].keys():
         try:
-            values = [float(row[key]) for row in data]
-            numeric_fields.append((key, values))
+            float(data[0][key])
+            numeric_keys.append(key)
         except (ValueError, TypeError):
             continue
 
-    # Calculate statistics for each field
-    for field, values in numeric_fields:
-        arr = np.array(values)
-
+    if not numeric_keys:
+        return summary
+
+    # Build one (samples x fields) array instead of a list per column
+    num_rows = len(data)
+    try:
+        arr = np.fromiter(
+            (float(row[key]) for row in data for key in numeric_keys),
+            dtype=np.float64,
+            count=num_rows * len(numeric_keys)
+        ).reshape(num_rows, len(numeric_keys))
+    except (ValueError, TypeError):
+        # A later row is non-numeric: keep only columns that fully convert
+        columns = []
+        for key in list(numeric_keys):
+            try:
+                columns.append([float(row[key]) for row in data])
+            except (ValueError, TypeError):
+                numeric_keys.remove(key)
+        arr = np.array(columns, dtype=np.float64).T.reshape(num_rows, len(numeric_keys))
+
+    # Calculate statistics for all fields at once
+    means = arr.mean(axis=0)
+    stds = arr.std(axis=0)
+    mins = arr.min(axis=0)
+    maxs = arr.max(axis=0)
+    medians = np.median(arr, axis=0)
+
+    for i, field in enumerate(numeric_keys):
         summary['statistics'][field] = {
-            'mean': float(np.mean(arr)),
-            'std': float(np.std(arr)),
-            'min': float(np.min(arr)),
-            'max': float(np.max(arr)),
-            'median': float(np.median(arr))
+            'mean': float(means[i]),
+            'std': float(stds[i]),
+            'min': float(mins[i]),
+            'max': float(maxs[i]),
+            'median': float(medians[i])
         }
 
     return summary
@@ -5,13 +5,68 @@ Real-time data logging with buffering for live plots.
 """
 
 import csv
+import io
+import operator
+import os
+import queue
 import time
 from collections import deque
+from itertools import islice
 from pathlib import Path
 import threading
 from typing import Dict, List, Optional
 
 
+_QUOTE_CHARS = (',', '"', '\r', '\n')
+
+# Value types row_format may be applied to (see _write_batch)
+_FORMAT_TYPES = frozenset((int,))
+
+# Max buffers per writev() call (POSIX guarantees at least 16, Linux allows 1024)
+_IOV_MAX = 1024
+
+
+def _needs_quote(text: str) -> bool:
+    """Check whether a CSV field must be quoted."""
+    return any(c in text for c in _QUOTE_CHARS)
+
+
+def _format_field(value) -> str:
+    """Format a single CSV field the same way csv.writer does."""
+    if type(value) is float or type(value) is int:
+        return repr(value)
+    if value is None:
+        return ''
+    value = str(value)
+    if _needs_quote(value):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def _write_all(fd: int, chunks: List[bytes]):
+    """Write byte chunks to a raw file descriptor, gathering them with writev() where available."""
+    if not hasattr(os, 'writev'):
+        data = memoryview(b''.join(chunks))
+        while data:
+            data = data[os.write(fd, data):]
+        return
+
+    for start in range(0, len(chunks), _IOV_MAX):
+        group = chunks[start:start + _IOV_MAX]
+        written = os.writev(fd, group)
+
+        # Short write: skip the chunks written in full, then finish the
+        # rest with plain write() calls
+        for chunk in group:
+            if written >= len(chunk):
+                written -= len(chunk)
+                continue
+            remaining = memoryview(chunk)[written:]
+            written = 0
+            while remaining:
+                remaining = remaining[os.write(fd, remaining):]
+
+
 class DataLogger:
     """
     Real-time data logging with ring buffer for live plotting.
@@ -20,15 +75,23 @@ class DataLogger:
     def __init__(self, buffer_size: int = 10000):
         self.buffer = deque(maxlen=buffer_size)  # Ring buffer for live plots
         self.csv_file: Optional[Path] = None
-        self.csv_writer = None
-        self.file_handle = None
+        self._fd: Optional[int] = None  # Raw file descriptor, written by the writer thread
         self.is_logging = False
         self.lock = threading.Lock()
         self.headers: List[str] = []
+        self._getter = None  # Builds a row tuple in header order (see start_logging)
+        self._row_format: Optional[bytes] = None  # Fast per-row format (see start_logging)
         self.sample_count = 0
-        self.flush_interval = 100  # Flush every N samples
+        self.flush_interval = 1000  # Max samples written per batch
+
+        # Samples are handed to a background writer thread (see _drain_loop);
+        # each logging session gets a fresh queue
+        self._q = queue.SimpleQueue()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_error: Optional[BaseException] = None  # Re-raised by stop_logging
 
-    def start_logging(self, filepath: Path, headers: List[str], metadata: Dict = None):
+    def start_logging(self, filepath: Path, headers: List[str], metadata: Dict = None,
+                      row_format: Optional[bytes] = None):
         """
         Start logging to CSV file.
 
@@ -36,27 +99,54 @@ class DataLogger:
             filepath: Path to CSV file
             headers: List of column headers
             metadata: Optional metadata to write as comments at start of file
+            row_format: Optional bytes %-format of %d fields for one CSV line
+                (including the line ending), e.g. b"%d,%d\r\n". It is used
+                for rows of ints only; other rows (floats, missing values)
+                are written the generic way, so nothing is truncated.
         """
         with self.lock:
             self.csv_file = Path(filepath)
             self.csv_file.parent.mkdir(parents=True, exist_ok=True)
 
-            self.file_handle = open(self.csv_file, 'w', newline='')
+            self._fd = os.open(self.csv_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+
+            # Hint the kernel that the file is written sequentially (Linux)
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(self._fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
 
             # Write metadata as comments
+            header_buf = io.StringIO()
             if metadata:
                 for key, value in metadata.items():
-                    self.file_handle.write(f"# {key}: {value}\n")
+                    header_buf.write(f"# {key}: {value}\n")
 
             # Write headers
-            self.csv_writer = csv.DictWriter(self.file_handle, fieldnames=headers)
-            self.csv_writer.writeheader()
+            csv.writer(header_buf).writerow(headers)
+            _write_all(self._fd, [header_buf.getvalue().encode('utf-8')])
+
+            # Samples are stored and written as tuples in header order
+            if len(headers) > 1:
+                self._getter = operator.itemgetter(*headers)
+            elif headers:
+                getter = operator.itemgetter(headers[0])
+                self._getter = lambda d: (getter(d),)
+            else:
+                self._getter = lambda d: ()
 
             self.headers = headers
+            self._row_format = row_format
             self.is_logging = True
             self.buffer.clear()
             self.sample_count = 0
 
+            # A new queue, so rows racing the previous stop_logging() can't
+            # reach this file
+            self._q = queue.SimpleQueue()
+            self._writer_error = None
+            self._writer_thread = threading.Thread(target=self._drain_loop, args=(self._q,),
+                                                   daemon=True)
+            self._writer_thread.start()
+
     def log(self, data_dict: Dict):
         """
         Log a single data point.
@@ -64,6 +154,7 @@ class DataLogger:
         Args:
             data_dict: Dictionary with sensor readings
         """
+        q = self._q  # Read before is_logging: a row racing stop_logging() goes to the old queue
         if not self.is_logging:
             return
 
@@ -71,18 +162,84 @@ class DataLogger:
         if 'timestamp' not in data_dict:
             data_dict['timestamp'] = time.time()
 
-        with self.lock:
-            # Add to ring buffer (for live plotting)
-            self.buffer.append(data_dict.copy())
+        # Immutable row tuple: shared by the ring buffer and the writer thread
+        try:
+            row = self._getter(data_dict)
+        except KeyError:
+            # Missing columns are written empty
+            row = tuple(data_dict.get(h) for h in self.headers)
+
+        # No lock needed: deque.append and SimpleQueue.put are atomic
+        self.buffer.append(row)  # Ring buffer for live plotting
+        q.put(row)               # CSV is written by the writer thread
+        self.sample_count += 1
+
+    def log_row(self, row: tuple):
+        """
+        Log a single data point already laid out in header order.
 
-            # Write to CSV
-            if self.csv_writer:
-                self.csv_writer.writerow(data_dict)
-                self.sample_count += 1
+        Args:
+            row: Tuple of values, one per header
+        """
+        q = self._q
+        if not self.is_logging:
+            return
+
+        self.buffer.append(row)
+        q.put(row)
+        self.sample_count += 1
+
+    @staticmethod
+    def _format_row(row: tuple) -> bytes:
+        """Format one encoded CSV line."""
+        return (','.join(map(_format_field, row)) + '\r\n').encode('utf-8')
+
+    def _write_batch(self, batch: List[tuple]):
+        """Write a batch of samples to the CSV file in a single gathered write."""
+        fmt = self._row_format
+        if fmt is None:
+            _write_all(self._fd, list(map(self._format_row, batch)))
+            return
+
+        format_row = self._format_row
+        chunks = []
+        for row in batch:
+            # %d would silently truncate floats
+            if _FORMAT_TYPES.issuperset(map(type, row)):
+                chunks.append(fmt % row)
+            else:
+                chunks.append(format_row(row))  # e.g. a float or missing (None) value
+        _write_all(self._fd, chunks)
+
+    def _drain_loop(self, q: queue.SimpleQueue):
+        """
+        Writer thread: drain queued samples in batches until a None sentinel.
+
+        Args:
+            q: Queue of the logging session this thread writes
+        """
+        while True:
+            item = q.get()
+            batch = []
+            while item is not None:
+                batch.append(item)
+                if len(batch) >= self.flush_interval:
+                    break
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    break
+
+            # After a write error keep draining (so the queue doesn't grow)
+            # but drop samples; stop_logging() re-raises the error
+            if batch and self._writer_error is None:
+                try:
+                    self._write_batch(batch)
+                except Exception as e:
+                    self._writer_error = e
 
-                # Periodic flush for safety
-                if self.sample_count % self.flush_interval == 0:
-                    self.file_handle.flush()
+            if item is None:
+                return
 
     def get_recent_data(self, n: int = 1000) -> List[Dict]:
         """
@@ -95,23 +252,41 @@ class DataLogger:
             List of data dictionaries
         """
         with self.lock:
-            return list(self.buffer)[-n:]
+            headers = self.headers
+            # Walk back from the newest sample instead of copying the whole buffer
+            recent = list(islice(reversed(self.buffer), max(n, 0)))
+        recent.reverse()
+        return [dict(zip(headers, row)) for row in recent]
 
     def get_buffer_data(self) -> List[Dict]:
         """Get all buffered data."""
         with self.lock:
-            return list(self.buffer)
+            headers = self.headers
+            rows = list(self.buffer)
+        return [dict(zip(headers, row)) for row in rows]
 
     def stop_logging(self):
         """Stop logging and close file."""
         with self.lock:
-            if self.file_handle:
-                self.file_handle.flush()
-                self.file_handle.close()
-                self.file_handle = None
-                self.csv_writer = None
-
             self.is_logging = False
+
+            # Let the writer thread drain remaining samples
+            if self._writer_thread:
+                self._q.put(None)
+                self._writer_thread.join()
+                self._writer_thread = None
+
+            if self._fd is not None:
+                try:
+                    os.fsync(self._fd)
+                finally:
+                    os.close(self._fd)
+                    self._fd = None
+
+            error, self._writer_error = self._writer_error, None
+            if error is not None:
+                raise error
+
             print(f"Logged {self.sample_count} samples to {self.csv_file}")
 
     def clear_buffer(self):
@@ -5,10 +5,41 @@ Organizes test data into sessions with automatic directory creation
 and metadata tracking.
 """
 
-import json
+import atexit
+import os
+import weakref
 from pathlib import Path
-from datetime import datetime
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
+
+from . import _json
+from ._clock import now_iso, now_stamp
+
+# Sessions holding tests added with autosave=False that are not yet in
+# session.json; saved by _save_dirty_sessions() at interpreter exit
+_dirty_sessions = weakref.WeakSet()
+
+
+def _save_dirty_sessions():
+    """Save pending changes of all dirty sessions at interpreter exit."""
+    for session in list(_dirty_sessions):
+        session._save_at_exit()
+
+
+atexit.register(_save_dirty_sessions)
+
+
+def new_session_csv_path(prefix: str, base_dir: Path = Path("data/sessions")) -> Path:
+    """
+    Get a timestamped CSV log path for a test run.
+
+    Args:
+        prefix: File name prefix (e.g., 'cycle_test')
+        base_dir: Directory for session logs
+
+    Returns:
+        Path like base_dir / 'cycle_test_20240131_140509.csv'
+    """
+    return Path(base_dir) / f"{prefix}_{now_stamp()}.csv"
 
 
 class Session:
@@ -29,7 +60,7 @@ class Session:
         # Metadata
         self.metadata = {
             'session_id': session_id,
-            'created': datetime.now().isoformat(),
+            'created': now_iso(),
             'platform': 'unknown',
             'hardware': {},
             'tests': [],
@@ -41,6 +72,14 @@ class Session:
         self.data_dir = self.session_dir / 'data'
         self.config_dir = self.session_dir / 'config'
 
+        # Tests added with autosave=False are appended to an append-only
+        # sidecar until flush() folds them into session.json
+        self.tests_file = self.session_dir / 'tests.jsonl'
+        self._tests_fh = None
+
+        # Unsaved metadata changes (see add_test / flush)
+        self._dirty = False
+
     def create(self, platform: str = 'teensy', hardware_info: dict = None):
         """
         Create session directory structure.
@@ -61,11 +100,13 @@ class Session:
             self.metadata['hardware'] = hardware_info
 
         # Save metadata
+        self._dirty = True
         self.save_metadata()
 
     def add_test(self, test_id: str, test_type: str, config: dict,
                  data_file: Optional[Path] = None,
-                 plot_files: Optional[List[Path]] = None) -> dict:
+                 plot_files: Optional[List[Path]] = None,
+                 autosave: bool = True) -> dict:
         """
         Add test to session.
 
@@ -75,6 +116,11 @@ class Session:
             config: Test configuration dict
             data_file: Path to CSV data file (relative to session_dir)
             plot_files: List of plot file paths
+            autosave: Write session.json immediately. Pass False when adding
+                many tests in a row and call flush() afterwards; until then
+                the tests are only in the tests.jsonl sidecar, which
+                Session.load_metadata() merges (other readers of
+                session.json do not see them).
 
         Returns:
             Test record dict
@@ -82,7 +128,7 @@ class Session:
         test_record = {
             'test_id': test_id,
             'test_type': test_type,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now_iso(),
             'config': config,
             'data_file': str(data_file) if data_file else None,
             'plot_files': [str(p) for p in plot_files] if plot_files else [],
@@ -90,7 +136,18 @@ class Session:
         }
 
         self.metadata['tests'].append(test_record)
-        self.save_metadata()
+        self._dirty = True
+
+        if autosave:
+            self.flush()
+            return test_record
+
+        # Append to the sidecar instead of rewriting session.json
+        if self._tests_fh is None:
+            self._tests_fh = open(self.tests_file, 'ab', buffering=1 << 16)
+        self._tests_fh.write(_json.dumps(test_record, indent=None) + b'\n')
+        self._tests_fh.flush()
+        _dirty_sessions.add(self)
 
         return test_record
 
@@ -109,21 +166,74 @@ class Session:
         return None
 
     def save_metadata(self):
-        """Save session metadata to JSON file."""
+        """Save session metadata to JSON file if there are unsaved changes."""
+        if not self._dirty:
+            return
+        self.flush()
+
+    def flush(self):
+        """Write session metadata to JSON file unconditionally and clear the tests sidecar."""
         metadata_file = self.session_dir / 'session.json'
-        with open(metadata_file, 'w') as f:
-            json.dump(self.metadata, f, indent=2)
+        metadata_file.write_bytes(_json.dumps(self.metadata))
+
+        # All appended tests are now in session.json
+        self._close_tests_file()
+        if self.tests_file.exists():
+            self.tests_file.unlink()
+
+        self._dirty = False
+        _dirty_sessions.discard(self)
+
+    def _save_at_exit(self):
+        """Save pending changes at interpreter exit unless the session was deleted."""
+        if self.session_dir.exists():
+            self.save_metadata()
+
+    def _close_tests_file(self):
+        """Close the tests sidecar file handle if open."""
+        if self._tests_fh is not None:
+            self._tests_fh.close()
+            self._tests_fh = None
 
     def load_metadata(self):
         """Load session metadata from JSON file."""
         metadata_file = self.session_dir / 'session.json'
         if metadata_file.exists():
-            with open(metadata_file, 'r') as f:
-                self.metadata = json.load(f)
+            self.metadata = _json.loads_small(metadata_file.read_bytes())
+            self._dirty = False
+
+        # Tests appended since session.json was last written
+        if self.tests_file.exists():
+            self._load_appended_tests()
+
+    def _load_appended_tests(self):
+        """
+        Merge test records from the tests sidecar into metadata.
+
+        The records stay in the sidecar; merging them does not make this
+        session responsible for folding them into session.json.
+        """
+        tests = self.metadata['tests']
+        known = {(t.get('test_id'), t.get('timestamp')) for t in tests}
+
+        with open(self.tests_file, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = _json.loads(line)
+                except ValueError:
+                    # Partially written last line (e.g. after a crash)
+                    continue
+
+                # Skip records already folded into session.json
+                if (record.get('test_id'), record.get('timestamp')) not in known:
+                    tests.append(record)
 
     def set_notes(self, notes: str):
         """Set session notes."""
         self.metadata['notes'] = notes
+        self._dirty = True
         self.save_metadata()
 
     def get_data_file_path(self, test_id: str, filename: str) -> Path:
@@ -161,8 +271,11 @@ class Session:
     def delete(self):
         """Delete session directory and all contents."""
         import shutil
+        self._close_tests_file()
         if self.session_dir.exists():
             shutil.rmtree(self.session_dir)
+        self._dirty = False
+        _dirty_sessions.discard(self)
 
     def get_summary(self) -> dict:
         """
@@ -194,6 +307,9 @@ class SessionManager:
         self.base_dir = Path(base_dir)
         self.base_dir.mkdir(parents=True, exist_ok=True)
 
+        # session_id -> (session.json signature, summary, test types)
+        self._cache: Dict[str, Tuple[tuple, dict, set]] = {}
+
     def create_session(self, prefix: str = "session",
                       platform: str = 'teensy',
                       hardware_info: dict = None) -> Session:
@@ -209,7 +325,7 @@ class SessionManager:
             New Session instance
         """
         # Generate unique session ID with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = now_stamp()
         session_id = f"{timestamp}_{prefix}"
 
         # Create session
@@ -246,20 +362,7 @@ class SessionManager:
         Returns:
             List of session summary dicts
         """
-        sessions = []
-
-        # Find all session directories
-        for session_dir in self.base_dir.iterdir():
-            if session_dir.is_dir():
-                session_id = session_dir.name
-                session = Session(session_id, self.base_dir)
-
-                if session.exists():
-                    try:
-                        session.load_metadata()
-                        sessions.append(session.get_summary())
-                    except Exception as e:
-                        print(f"Error loading session {session_id}: {e}")
+        sessions = [dict(summary) for summary, _ in self._scan_sessions()]
 
         # Sort sessions
         if sort_by == 'created':
@@ -284,6 +387,7 @@ class SessionManager:
         session = Session(session_id, self.base_dir)
         if session.exists():
             session.delete()
+            self._cache.pop(session_id, None)
             return True
         return False
 
@@ -314,20 +418,64 @@ class SessionManager:
         Returns:
             List of matching session summaries
         """
-        matching_sessions = []
+        return [dict(summary) for summary, test_types in self._scan_sessions()
+                if test_type in test_types]
 
-        for session_dir in self.base_dir.iterdir():
-            if session_dir.is_dir():
-                session_id = session_dir.name
-                session = Session(session_id, self.base_dir)
+    def _scan_sessions(self) -> List[Tuple[dict, set]]:
+        """
+        Load summaries of all sessions in base_dir.
+
+        Sessions whose session.json and tests.jsonl are unchanged since the
+        previous scan (same mtime and size) are served from cache instead
+        of re-parsed.
+
+        Returns:
+            List of (summary, test_types) tuples
+        """
+        results = []
+        seen = set()
 
+        with os.scandir(self.base_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+
+                # Directories without session.json are not sessions
                 try:
-                    session.load_metadata()
-                    test_types = [t['test_type'] for t in session.metadata['tests']]
+                    stat = os.stat(os.path.join(entry.path, 'session.json'))
+                except OSError:
+                    continue
+                signature = (stat.st_mtime_ns, stat.st_size)
 
-                    if test_type in test_types:
-                        matching_sessions.append(session.get_summary())
-                except:
+                session_id = entry.name
+                seen.add(session_id)
+
+                # Tests appended to the sidecar also change the summary
+                try:
+                    stat = os.stat(os.path.join(entry.path, 'tests.jsonl'))
+                    signature += (stat.st_mtime_ns, stat.st_size)
+                except OSError:
+                    pass
+
+                cached = self._cache.get(session_id)
+                if cached and cached[0] == signature:
+                    results.append((cached[1], cached[2]))
                     continue
 
-        return matching_sessions
+                session = Session(session_id, self.base_dir)
+                try:
+                    session.load_metadata()
+                    summary = session.get_summary()
+                    test_types = {t['test_type'] for t in session.metadata['tests']}
+                except Exception as e:
+                    print(f"Error loading session {session_id}: {e}")
+                    continue
+
+                self._cache[session_id] = (signature, summary, test_types)
+                results.append((summary, test_types))
+
+        # Forget sessions that no longer exist
+        for session_id in self._cache.keys() - seen:
+            del self._cache[session_id]
+
+        return results
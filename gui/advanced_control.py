@@ -4,11 +4,117 @@ Advanced Motor Control Panel
 PID tuning, motion profiles, and automated cycle testing.
 """
 
+import hashlib
+import json
+import queue
+import sys
+import time
+from dataclasses import dataclass
+from functools import partial
 import tkinter as tk
 from tkinter import ttk, messagebox
+from typing import Optional
+from operator import itemgetter
 from pathlib import Path
-import time
-import threading
+
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import numpy as np
+
+from data.session import new_session_csv_path
+from hardware.base_controller import SENSOR_FIELDS
+
+
+# Column order of cycle test CSV logs
+CYCLE_LOG_HEADERS = ('cycle', 'timestamp', 'position', 'velocity', 'current',
+                     'force_tendon', 'force_tip', 'angle_joint')
+
+# Cycle log line format for all-int rows; DataLogger writes rows holding
+# floats (e.g. iMX8 JSON values) the generic way
+CYCLE_LOG_FORMAT = b",".join([b"%d"] * len(CYCLE_LOG_HEADERS)) + b"\r\n"
+
+# Cycle log metadata; the None values are filled in per run
+_CYCLE_META_TEMPLATE = {'test_type': 'cycle_test', 'num_cycles': None,
+                        'pos_start': None, 'pos_end': None}
+
+# Sensor dict -> tuple of SENSOR_FIELDS values (the columns after 'cycle')
+_sensor_values = itemgetter(*SENSOR_FIELDS)
+
+# Grid options shared by every parameter row (see _make_param_row)
+_PARAM_LABEL_GRID = dict(column=0, sticky=tk.W, pady=2)
+_PARAM_ENTRY_GRID = dict(column=1, padx=5)
+_PARAM_SCALE_GRID = dict(column=2, sticky=tk.EW, padx=5)
+
+
+# Cycle steps are scheduled this many ms early and finish with _precise_sleep()
+_DWELL_SPIN_MS = 2
+
+
+def _precise_sleep(seconds: float):
+    """Sleep with sub-millisecond accuracy: coarse sleep, then spin for the last 1 ms."""
+    end = time.perf_counter() + seconds
+    rough = seconds - 0.001
+    if rough > 0:
+        time.sleep(rough)
+    while time.perf_counter() < end:
+        pass
+
+
+def _set_timer_resolution(enabled: bool):
+    """Request 1 ms system timer resolution on Windows (default ~15.6 ms); no-op elsewhere."""
+    if sys.platform != 'win32':
+        return
+    import ctypes
+    if enabled:
+        ctypes.windll.winmm.timeBeginPeriod(1)
+    else:
+        ctypes.windll.winmm.timeEndPeriod(1)
+
+
+@dataclass
+class CycleState:
+    """Progress and parameters of a running cycle test (see _cycle_step)."""
+
+    # Explicit slots (dataclass(slots=True) needs Python 3.10); fields
+    # therefore have no defaults
+    __slots__ = ('num_cycles', 'pos_start', 'pos_end', 'dwell_start', 'dwell_end',
+                 'cycle_delay', 'log_path', 'cycle', 'phase', 'deadline')
+
+    num_cycles: int
+    pos_start: int
+    pos_end: int
+    dwell_start: float
+    dwell_end: float
+    cycle_delay: float
+    log_path: Path
+    cycle: int   # Index of the current cycle
+    phase: str   # 'to_start', 'at_start' or 'at_end'
+    deadline: float  # time.perf_counter() at which the next step is due
+
+
+def _velocity_profile(max_velocity, acceleration, deceleration, dt=1e-3):
+    """
+    Compute a trapezoidal velocity profile: accelerate, cruise, decelerate.
+
+    The cruise phase lasts as long as the longer ramp so both ramps stay
+    visible. Jerk limiting (S-curve ramps) is not modeled.
+
+    Args:
+        max_velocity: Cruise velocity (RPM)
+        acceleration: Acceleration (RPM/s), > 0
+        deceleration: Deceleration (RPM/s), > 0
+        dt: Time step (s)
+
+    Returns:
+        (t, v) arrays of time (s) and velocity (RPM)
+    """
+    t_acc = max_velocity / acceleration
+    t_dec = max_velocity / deceleration
+    total = t_acc + max(t_acc, t_dec) + t_dec
+
+    t = np.arange(0.0, total + dt, dt)
+    v = np.clip(np.minimum(acceleration * t, deceleration * (total - t)), 0, max_velocity)
+    return t, v
 
 
 class AdvancedControlPanel(ttk.LabelFrame):
@@ -42,11 +148,41 @@ class AdvancedControlPanel(ttk.LabelFrame):
             'cycle_delay': tk.DoubleVar(value=0.1)      # seconds between cycles
         }
 
+        # Mirror every Tk variable into a plain attribute (self._kp, self._pos_start, ...)
+        # so reads don't round-trip through the Tcl interpreter. Keys whose
+        # entry text is not a valid value are listed in _invalid_params.
+        self._invalid_params = set()
+        for params in (self.pid_params, self.motion_params, self.cycle_params):
+            for key, var in params.items():
+                setattr(self, f'_{key}', var.get())
+                var.trace_add('write', lambda *_, k=key, v=var: self._mirror_var(k, v))
+
         self.cycle_running = False
-        self.cycle_thread = None
+        self._cycle_state: Optional[CycleState] = None  # Advanced by _cycle_step()
+
+        # Presets, configs and cycle logs are all saved under data/
+        try:
+            Path("data/sessions").mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            print(f"Could not create data directory: {e}")
+
+        # SHA-1 of the last payload written per file, to skip unchanged saves
+        self._saved_hashes = {}
+
+        # Reused record for cycle test samples, in CYCLE_LOG_HEADERS order
+        self._sample_buf = [0] * len(CYCLE_LOG_HEADERS)
+
+        # (checked_at, connected) for _is_connected()
+        self._conn_cache = (0.0, False)
+
+        # Cycle status updates, applied to the widgets by _drain_ui_q()
+        self._ui_q = queue.Queue()
+        self._last_status_ts = 0.0
 
         self._create_widgets()
 
+        self.after(50, self._drain_ui_q)
+
     def _create_widgets(self):
         """Create advanced control widgets."""
         # Create notebook for sub-sections
@@ -62,6 +198,11 @@ class AdvancedControlPanel(ttk.LabelFrame):
         # Cycle Test Tab
         self._create_cycle_tab()
 
+        # Transient result messages (see _flash)
+        self.status_bar = ttk.Label(self, text="", foreground="green")
+        self.status_bar.pack(fill=tk.X, pady=(5, 0))
+        self._flash_after_id = None
+
     def _create_pid_tab(self):
         """Create PID tuning controls."""
         pid_frame = ttk.Frame(self.notebook, padding=10)
@@ -71,23 +212,9 @@ class AdvancedControlPanel(ttk.LabelFrame):
         params_frame = ttk.LabelFrame(pid_frame, text="PID Parameters", padding=10)
         params_frame.pack(fill=tk.X, pady=5)
 
-        # Kp
-        ttk.Label(params_frame, text="Kp (Proportional):").grid(row=0, column=0, sticky=tk.W, pady=2)
-        ttk.Entry(params_frame, textvariable=self.pid_params['kp'], width=10).grid(row=0, column=1, padx=5)
-        ttk.Scale(params_frame, from_=0, to=10, orient=tk.HORIZONTAL,
-                 variable=self.pid_params['kp']).grid(row=0, column=2, sticky=tk.EW, padx=5)
-
-        # Ki
-        ttk.Label(params_frame, text="Ki (Integral):").grid(row=1, column=0, sticky=tk.W, pady=2)
-        ttk.Entry(params_frame, textvariable=self.pid_params['ki'], width=10).grid(row=1, column=1, padx=5)
-        ttk.Scale(params_frame, from_=0, to=1, orient=tk.HORIZONTAL,
-                 variable=self.pid_params['ki']).grid(row=1, column=2, sticky=tk.EW, padx=5)
-
-        # Kd
-        ttk.Label(params_frame, text="Kd (Derivative):").grid(row=2, column=0, sticky=tk.W, pady=2)
-        ttk.Entry(params_frame, textvariable=self.pid_params['kd'], width=10).grid(row=2, column=1, padx=5)
-        ttk.Scale(params_frame, from_=0, to=1, orient=tk.HORIZONTAL,
-                 variable=self.pid_params['kd']).grid(row=2, column=2, sticky=tk.EW, padx=5)
+        self._make_param_row(params_frame, 0, "Kp (Proportional):", self.pid_params['kp'], 0, 10)
+        self._make_param_row(params_frame, 1, "Ki (Integral):", self.pid_params['ki'], 0, 1)
+        self._make_param_row(params_frame, 2, "Kd (Derivative):", self.pid_params['kd'], 0, 1)
 
         params_frame.columnconfigure(2, weight=1)
 
@@ -96,11 +223,11 @@ class AdvancedControlPanel(ttk.LabelFrame):
         preset_frame.pack(fill=tk.X, pady=5)
 
         ttk.Button(preset_frame, text="Conservative",
-                  command=lambda: self._apply_pid_preset(1.0, 0.05, 0.01)).pack(side=tk.LEFT, padx=2)
+                  command=partial(self._apply_pid_preset, 1.0, 0.05, 0.01)).pack(side=tk.LEFT, padx=2)
         ttk.Button(preset_frame, text="Moderate",
-                  command=lambda: self._apply_pid_preset(2.0, 0.1, 0.05)).pack(side=tk.LEFT, padx=2)
+                  command=partial(self._apply_pid_preset, 2.0, 0.1, 0.05)).pack(side=tk.LEFT, padx=2)
         ttk.Button(preset_frame, text="Aggressive",
-                  command=lambda: self._apply_pid_preset(5.0, 0.5, 0.1)).pack(side=tk.LEFT, padx=2)
+                  command=partial(self._apply_pid_preset, 5.0, 0.5, 0.1)).pack(side=tk.LEFT, padx=2)
 
         # Control buttons
         control_frame = ttk.Frame(pid_frame)
@@ -134,29 +261,14 @@ class AdvancedControlPanel(ttk.LabelFrame):
         params_frame = ttk.LabelFrame(motion_frame, text="Motion Limits", padding=10)
         params_frame.pack(fill=tk.X, pady=5)
 
-        # Max Velocity
-        ttk.Label(params_frame, text="Max Velocity (RPM):").grid(row=0, column=0, sticky=tk.W, pady=2)
-        ttk.Entry(params_frame, textvariable=self.motion_params['max_velocity'], width=10).grid(row=0, column=1, padx=5)
-        ttk.Scale(params_frame, from_=0, to=1000, orient=tk.HORIZONTAL,
-                 variable=self.motion_params['max_velocity']).grid(row=0, column=2, sticky=tk.EW, padx=5)
-
-        # Acceleration
-        ttk.Label(params_frame, text="Acceleration (RPM/s):").grid(row=1, column=0, sticky=tk.W, pady=2)
-        ttk.Entry(params_frame, textvariable=self.motion_params['acceleration'], width=10).grid(row=1, column=1, padx=5)
-        ttk.Scale(params_frame, from_=100, to=5000, orient=tk.HORIZONTAL,
-                 variable=self.motion_params['acceleration']).grid(row=1, column=2, sticky=tk.EW, padx=5)
-
-        # Deceleration
-        ttk.Label(params_frame, text="Deceleration (RPM/s):").grid(row=2, column=0, sticky=tk.W, pady=2)
-        ttk.Entry(params_frame, textvariable=self.motion_params['deceleration'], width=10).grid(row=2, column=1, padx=5)
-        ttk.Scale(params_frame, from_=100, to=5000, orient=tk.HORIZONTAL,
-                 variable=self.motion_params['deceleration']).grid(row=2, column=2, sticky=tk.EW, padx=5)
-
-        # Jerk Limit
-        ttk.Label(params_frame, text="Jerk Limit (RPM/s²):").grid(row=3, column=0, sticky=tk.W, pady=2)
-        ttk.Entry(params_frame, textvariable=self.motion_params['jerk_limit'], width=10).grid(row=3, column=1, padx=5)
-        ttk.Scale(params_frame, from_=1000, to=10000, orient=tk.HORIZONTAL,
-                 variable=self.motion_params['jerk_limit']).grid(row=3, column=2, sticky=tk.EW, padx=5)
+        self._make_param_row(params_frame, 0, "Max Velocity (RPM):",
+                             self.motion_params['max_velocity'], 0, 1000)
+        self._make_param_row(params_frame, 1, "Acceleration (RPM/s):",
+                             self.motion_params['acceleration'], 100, 5000)
+        self._make_param_row(params_frame, 2, "Deceleration (RPM/s):",
+                             self.motion_params['deceleration'], 100, 5000)
+        self._make_param_row(params_frame, 3, "Jerk Limit (RPM/s²):",
+                             self.motion_params['jerk_limit'], 1000, 10000)
 
         params_frame.columnconfigure(2, weight=1)
 
@@ -169,12 +281,44 @@ class AdvancedControlPanel(ttk.LabelFrame):
         ttk.Button(control_frame, text="Read Current Profile",
                   command=self._read_motion_profile).pack(side=tk.LEFT, padx=5)
 
-        # Profile visualization (placeholder)
+        # Profile visualization
         viz_frame = ttk.LabelFrame(motion_frame, text="Profile Preview", padding=10)
         viz_frame.pack(fill=tk.BOTH, expand=True, pady=5)
 
-        ttk.Label(viz_frame, text="Velocity profile visualization\n(Coming soon)",
-                 foreground="gray").pack(expand=True)
+        self.profile_fig = Figure(figsize=(5, 2.5))
+        self.ax_profile = self.profile_fig.add_subplot(111)
+        self.ax_profile.set_xlabel('Time (s)')
+        self.ax_profile.set_ylabel('Velocity (RPM)')
+        self.ax_profile.grid(True, alpha=0.3)
+        self.line_profile, = self.ax_profile.plot([], [], 'b-')
+        self.profile_fig.tight_layout()
+
+        self.profile_canvas = FigureCanvasTkAgg(self.profile_fig, master=viz_frame)
+        self.profile_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        # Redraw (debounced) whenever a motion parameter changes
+        self._preview_after_id = None
+        for var in self.motion_params.values():
+            var.trace_add('write', lambda *_: self._schedule_preview())
+        self._redraw_preview()
+
+    def _schedule_preview(self):
+        """Redraw the profile preview once parameter changes settle (50 ms)."""
+        if self._preview_after_id is not None:
+            self.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.after(50, self._redraw_preview)
+
+    def _redraw_preview(self):
+        """Plot the velocity profile for the current motion parameters."""
+        self._preview_after_id = None
+        if min(self._max_velocity, self._acceleration, self._deceleration) <= 0:
+            return
+
+        t, v = _velocity_profile(self._max_velocity, self._acceleration, self._deceleration)
+        self.line_profile.set_data(t, v)
+        self.ax_profile.relim()
+        self.ax_profile.autoscale_view()
+        self.profile_canvas.draw_idle()
 
     def _create_cycle_tab(self):
         """Create cycle test controls."""
@@ -185,29 +329,16 @@ class AdvancedControlPanel(ttk.LabelFrame):
         params_frame = ttk.LabelFrame(cycle_frame, text="Cycle Parameters", padding=10)
         params_frame.pack(fill=tk.X, pady=5)
 
-        # Number of cycles
-        ttk.Label(params_frame, text="Number of Cycles:").grid(row=0, column=0, sticky=tk.W, pady=2)
-        ttk.Entry(params_frame, textvariable=self.cycle_params['num_cycles'], width=10).grid(row=0, column=1, padx=5)
-
-        # Start position
-        ttk.Label(params_frame, text="Start Position (counts):").grid(row=1, column=0, sticky=tk.W, pady=2)
-        ttk.Entry(params_frame, textvariable=self.cycle_params['pos_start'], width=10).grid(row=1, column=1, padx=5)
-
-        # End position
-        ttk.Label(params_frame, text="End Position (counts):").grid(row=2, column=0, sticky=tk.W, pady=2)
-        ttk.Entry(params_frame, textvariable=self.cycle_params['pos_end'], width=10).grid(row=2, column=1, padx=5)
-
-        # Dwell at start
-        ttk.Label(params_frame, text="Dwell at Start (s):").grid(row=3, column=0, sticky=tk.W, pady=2)
-        ttk.Entry(params_frame, textvariable=self.cycle_params['dwell_start'], width=10).grid(row=3, column=1, padx=5)
-
-        # Dwell at end
-        ttk.Label(params_frame, text="Dwell at End (s):").grid(row=4, column=0, sticky=tk.W, pady=2)
-        ttk.Entry(params_frame, textvariable=self.cycle_params['dwell_end'], width=10).grid(row=4, column=1, padx=5)
-
-        # Cycle delay
-        ttk.Label(params_frame, text="Inter-Cycle Delay (s):").grid(row=5, column=0, sticky=tk.W, pady=2)
-        ttk.Entry(params_frame, textvariable=self.cycle_params['cycle_delay'], width=10).grid(row=5, column=1, padx=5)
+        rows = (
+            ("Number of Cycles:", 'num_cycles'),
+            ("Start Position (counts):", 'pos_start'),
+            ("End Position (counts):", 'pos_end'),
+            ("Dwell at Start (s):", 'dwell_start'),
+            ("Dwell at End (s):", 'dwell_end'),
+            ("Inter-Cycle Delay (s):", 'cycle_delay'),
+        )
+        for row, (label, key) in enumerate(rows):
+            self._make_param_row(params_frame, row, label, self.cycle_params[key])
 
         # Status
         status_frame = ttk.LabelFrame(cycle_frame, text="Cycle Status", padding=10)
@@ -237,30 +368,101 @@ class AdvancedControlPanel(ttk.LabelFrame):
         ttk.Button(control_frame, text="Save Config",
                   command=self._save_cycle_config).pack(side=tk.LEFT, padx=5)
 
+    def _flash(self, message, ok=True):
+        """Show a result message in the status line for a few seconds."""
+        self.status_bar.config(text=message, foreground="green" if ok else "red")
+        if self._flash_after_id is not None:
+            self.after_cancel(self._flash_after_id)
+        self._flash_after_id = self.after(3000, self._clear_flash)
+
+    def _clear_flash(self):
+        """Clear the status line."""
+        self._flash_after_id = None
+        self.status_bar.config(text="")
+
+    def _is_connected(self) -> bool:
+        """Check the controller connection, reusing the result for 100 ms."""
+        now = time.monotonic()
+        checked_at, connected = self._conn_cache
+        if now - checked_at < 0.1:
+            return connected
+
+        connected = self.teensy.connected
+        self._conn_cache = (now, connected)
+        return connected
+
+    def _make_param_row(self, parent, row, label, var, from_=None, to=None):
+        """
+        Grid a label + entry row for a parameter, with a slider if a range is given.
+
+        Args:
+            parent: Frame to grid into
+            row: Grid row
+            label: Label text
+            var: Tk variable bound to the entry (and slider)
+            from_: Slider minimum (no slider if None)
+            to: Slider maximum
+        """
+        ttk.Label(parent, text=label).grid(row=row, **_PARAM_LABEL_GRID)
+        ttk.Entry(parent, textvariable=var, width=10).grid(row=row, **_PARAM_ENTRY_GRID)
+        if from_ is not None:
+            ttk.Scale(parent, from_=from_, to=to, orient=tk.HORIZONTAL,
+                      variable=var).grid(row=row, **_PARAM_SCALE_GRID)
+
+    def _mirror_var(self, key, var):
+        """Copy a Tk variable's new value to its mirror attribute."""
+        try:
+            setattr(self, f'_{key}', var.get())
+            self._invalid_params.discard(key)
+        except tk.TclError:
+            # Entry holds a partial/invalid value; the mirror is stale until fixed
+            self._invalid_params.add(key)
+
+    def _params_valid(self, params) -> bool:
+        """
+        Check that none of the given parameters holds invalid entry text.
+
+        Args:
+            params: Dict of parameter key -> Tk variable (e.g. self.cycle_params)
+
+        Returns:
+            True if all are valid; otherwise shows an error and returns False
+        """
+        invalid = self._invalid_params.intersection(params)
+        if invalid:
+            messagebox.showerror("Error", f"Invalid value for: {', '.join(sorted(invalid))}")
+            return False
+        return True
+
     # PID Control Methods
 
     def _apply_pid_preset(self, kp, ki, kd):
         """Apply PID preset values."""
-        self.pid_params['kp'].set(kp)
-        self.pid_params['ki'].set(ki)
-        self.pid_params['kd'].set(kd)
+        # Set all three variables in one Tcl round-trip (write traces still fire)
+        self.tk.eval('; '.join(
+            f"set {self.pid_params[key]} {float(value)!r}"
+            for key, value in (('kp', kp), ('ki', ki), ('kd', kd))
+        ))
 
     def _apply_pid(self):
         """Send PID parameters to Teensy."""
-        if not self.teensy.connected:
+        if not self._is_connected():
             messagebox.showerror("Error", "Not connected to Teensy")
             return
 
+        if not self._params_valid(self.pid_params):
+            return
+
         try:
-            kp = self.pid_params['kp'].get()
-            ki = self.pid_params['ki'].get()
-            kd = self.pid_params['kd'].get()
+            kp = self._kp
+            ki = self._ki
+            kd = self._kd
 
             # Send PID parameters (Teensy firmware needs to implement this)
             success = self.teensy.set_pid_params(kp, ki, kd)
 
             if success:
-                messagebox.showinfo("Success", f"PID parameters applied:\nKp={kp}, Ki={ki}, Kd={kd}")
+                self._flash(f"PID parameters applied: Kp={kp}, Ki={ki}, Kd={kd}")
             else:
                 messagebox.showerror("Error", "Failed to apply PID parameters")
         except Exception as e:
@@ -268,7 +470,7 @@ class AdvancedControlPanel(ttk.LabelFrame):
 
     def _read_pid(self):
         """Read PID parameters from Teensy."""
-        if not self.teensy.connected:
+        if not self._is_connected():
             messagebox.showerror("Error", "Not connected to Teensy")
             return
 
@@ -278,47 +480,65 @@ class AdvancedControlPanel(ttk.LabelFrame):
                 self.pid_params['kp'].set(params['kp'])
                 self.pid_params['ki'].set(params['ki'])
                 self.pid_params['kd'].set(params['kd'])
-                messagebox.showinfo("Success", "PID parameters read from Teensy")
+                self._flash("PID parameters read from Teensy")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to read PID: {str(e)}")
 
     def _save_pid_preset(self):
         """Save current PID parameters to file."""
-        import json
+        if not self._params_valid(self.pid_params):
+            return
+
         preset = {
-            'kp': self.pid_params['kp'].get(),
-            'ki': self.pid_params['ki'].get(),
-            'kd': self.pid_params['kd'].get()
+            'kp': self._kp,
+            'ki': self._ki,
+            'kd': self._kd
         }
 
         preset_file = Path("data/pid_preset.json")
-        preset_file.parent.mkdir(parents=True, exist_ok=True)
+        self._save_json(preset_file, preset)
+
+        self._flash(f"PID preset saved to {preset_file}")
 
-        with open(preset_file, 'w') as f:
-            json.dump(preset, f, indent=2)
+    def _save_json(self, path: Path, obj):
+        """
+        Write obj to a JSON file, skipping the write if it is unchanged.
+
+        Args:
+            path: Destination file
+            obj: JSON-serializable object
+        """
+        payload = json.dumps(obj, indent=2, sort_keys=True)
+        digest = hashlib.sha1(payload.encode('utf-8')).hexdigest()
+        if self._saved_hashes.get(path) == digest:
+            return
 
-        messagebox.showinfo("Saved", f"PID preset saved to {preset_file}")
+        path.write_text(payload)
+        self._saved_hashes[path] = digest
 
     # Motion Profile Methods
 
     def _apply_motion_profile(self):
         """Send motion profile to Teensy."""
-        if not self.teensy.connected:
+        if not self._is_connected():
             messagebox.showerror("Error", "Not connected to Teensy")
             return
 
+        if not self._params_valid(self.motion_params):
+            return
+
         try:
             profile = {
-                'max_velocity': self.motion_params['max_velocity'].get(),
-                'acceleration': self.motion_params['acceleration'].get(),
-                'deceleration': self.motion_params['deceleration'].get(),
-                'jerk_limit': self.motion_params['jerk_limit'].get()
+                'max_velocity': self._max_velocity,
+                'acceleration': self._acceleration,
+                'deceleration': self._deceleration,
+                'jerk_limit': self._jerk_limit
             }
 
             success = self.teensy.set_motion_profile(profile)
 
             if success:
-                messagebox.showinfo("Success", "Motion profile applied")
+                self._flash("Motion profile applied")
             else:
                 messagebox.showerror("Error", "Failed to apply motion profile")
         except Exception as e:
@@ -326,7 +546,7 @@ class AdvancedControlPanel(ttk.LabelFrame):
 
     def _read_motion_profile(self):
         """Read motion profile from Teensy."""
-        if not self.teensy.connected:
+        if not self._is_connected():
             messagebox.showerror("Error", "Not connected to Teensy")
             return
 
@@ -337,7 +557,7 @@ class AdvancedControlPanel(ttk.LabelFrame):
                 self.motion_params['acceleration'].set(profile['acceleration'])
                 self.motion_params['deceleration'].set(profile['deceleration'])
                 self.motion_params['jerk_limit'].set(profile['jerk_limit'])
-                messagebox.showinfo("Success", "Motion profile read from Teensy")
+                self._flash("Motion profile read from Teensy")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to read profile: {str(e)}")
 
@@ -345,7 +565,7 @@ class AdvancedControlPanel(ttk.LabelFrame):
 
     def _start_cycle_test(self):
         """Start automated cycle test."""
-        if not self.teensy.connected:
+        if not self._is_connected():
             messagebox.showerror("Error", "Not connected to Teensy")
             return
 
@@ -354,125 +574,193 @@ class AdvancedControlPanel(ttk.LabelFrame):
             return
 
         # Validate parameters
-        num_cycles = self.cycle_params['num_cycles'].get()
+        if not self._params_valid(self.cycle_params):
+            return
+
+        num_cycles = self._num_cycles
         if num_cycles < 1:
             messagebox.showerror("Error", "Number of cycles must be >= 1")
             return
 
-        # Start cycle test in background thread
+        try:
+            pos_start = self._pos_start
+            pos_end = self._pos_end
+
+            # Start data logging
+            log_path = new_session_csv_path("cycle_test")
+            meta = _CYCLE_META_TEMPLATE.copy()
+            meta['num_cycles'] = num_cycles
+            meta['pos_start'] = pos_start
+            meta['pos_end'] = pos_end
+            self.logger.start_logging(log_path, CYCLE_LOG_HEADERS, metadata=meta,
+                                      row_format=CYCLE_LOG_FORMAT)
+
+            self._cycle_state = CycleState(
+                num_cycles=num_cycles,
+                pos_start=pos_start,
+                pos_end=pos_end,
+                dwell_start=self._dwell_start,
+                dwell_end=self._dwell_end,
+                cycle_delay=self._cycle_delay,
+                log_path=log_path,
+                cycle=0,
+                phase='to_start',
+                deadline=time.perf_counter()
+            )
+        except Exception as e:
+            messagebox.showerror("Error", f"Cycle test failed: {str(e)}")
+            self._update_cycle_status("Error", 0, str(e), force=True)
+            return
+
+        # Cycle steps run on the Tk main loop, scheduled with after()
         self.cycle_running = True
         self.start_cycle_btn.config(state=tk.DISABLED)
         self.stop_cycle_btn.config(state=tk.NORMAL)
 
-        self.cycle_thread = threading.Thread(target=self._run_cycle_test)
-        self.cycle_thread.daemon = True
-        self.cycle_thread.start()
+        _set_timer_resolution(True)
+        self.after(0, self._cycle_step)
 
     def _stop_cycle_test(self):
-        """Stop cycle test."""
+        """Stop cycle test (takes effect at the next cycle step)."""
         self.cycle_running = False
         self.cycle_status_label.config(text="Stopping...", foreground="orange")
 
-    def _run_cycle_test(self):
-        """Execute cycle test (runs in background thread)."""
+    def _cycle_step(self):
+        """Run one phase of the cycle test and schedule the next one."""
+        state = self._cycle_state
+
         try:
-            num_cycles = self.cycle_params['num_cycles'].get()
-            pos_start = self.cycle_params['pos_start'].get()
-            pos_end = self.cycle_params['pos_end'].get()
-            dwell_start = self.cycle_params['dwell_start'].get()
-            dwell_end = self.cycle_params['dwell_end'].get()
-            cycle_delay = self.cycle_params['cycle_delay'].get()
+            # Finish the dwell precisely (the step was scheduled slightly early)
+            remaining = state.deadline - time.perf_counter()
+            if remaining > 0:
+                _precise_sleep(remaining)
 
-            # Start data logging
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            log_path = Path("data/sessions") / f"cycle_test_{timestamp}.csv"
-
-            headers = ['cycle', 'timestamp', 'position', 'velocity', 'current',
-                      'force_tendon', 'force_tip', 'angle_joint']
-            self.logger.start_logging(log_path, headers, metadata={
-                'test_type': 'cycle_test',
-                'num_cycles': num_cycles,
-                'pos_start': pos_start,
-                'pos_end': pos_end
-            })
-
-            for cycle in range(num_cycles):
-                if not self.cycle_running:
-                    break
-
-                # Update status
+            cycle = state.cycle
+            num_cycles = state.num_cycles
+
+            if not self.cycle_running or cycle >= num_cycles:
+                self._finish_cycle_test()
+                return
+
+            phase = state.phase
+
+            if phase == 'to_start':
                 self._update_cycle_status(
                     f"Cycle {cycle + 1}/{num_cycles}",
                     (cycle / num_cycles) * 100,
                     f"Moving to start position..."
                 )
 
-                # Move to start position
-                self.teensy.set_position(pos_start)
-                time.sleep(dwell_start)
+                # Move to start position, sample after the dwell
+                self.teensy.set_position(state.pos_start)
+                state.phase = 'at_start'
+                delay = state.dwell_start
 
-                # Log data
-                data = self.teensy.get_sensors()
-                if data:
-                    data['cycle'] = cycle
-                    self.logger.log(data)
+            elif phase == 'at_start':
+                # Sample and move to end position in one exchange
+                data = self.teensy.sample_and_move(state.pos_end)
+                self._log_cycle_sample(cycle, data)
 
-                # Move to end position
                 self._update_cycle_status(
                     f"Cycle {cycle + 1}/{num_cycles}",
                     ((cycle + 0.5) / num_cycles) * 100,
                     f"Moving to end position..."
                 )
 
-                self.teensy.set_position(pos_end)
-                time.sleep(dwell_end)
+                state.phase = 'at_end'
+                delay = state.dwell_end
 
-                # Log data
-                data = self.teensy.get_sensors()
-                if data:
-                    data['cycle'] = cycle
-                    self.logger.log(data)
+            else:  # 'at_end'
+                if self.teensy.fill_sensors(self._sample_buf, 1):
+                    self._sample_buf[0] = cycle
+                    self.logger.log_row(tuple(self._sample_buf))
 
                 # Inter-cycle delay
-                time.sleep(cycle_delay)
+                state.cycle = cycle + 1
+                state.phase = 'to_start'
+                delay = state.cycle_delay
 
-            # Finish
-            self.logger.stop_logging()
-            self._update_cycle_status("Completed", 100, f"{num_cycles} cycles finished")
-            messagebox.showinfo("Success", f"Cycle test completed!\nData saved to {log_path}")
+            state.deadline = time.perf_counter() + delay
+            self.after(max(0, int(delay * 1000) - _DWELL_SPIN_MS), self._cycle_step)
 
         except Exception as e:
+            self.logger.stop_logging()
             messagebox.showerror("Error", f"Cycle test failed: {str(e)}")
-            self._update_cycle_status("Error", 0, str(e))
+            self._update_cycle_status("Error", 0, str(e), force=True)
+            self._reset_cycle_controls()
+
+    def _log_cycle_sample(self, cycle, data):
+        """Log one sensor dict for the given cycle."""
+        if data:
+            buf = self._sample_buf
+            buf[0] = cycle
+            buf[1:] = _sensor_values(data)
+            self.logger.log_row(tuple(buf))
+
+    def _finish_cycle_test(self):
+        """Stop logging and report the result of a finished or stopped cycle test."""
+        state = self._cycle_state
+        self.logger.stop_logging()
+        self._reset_cycle_controls()
+
+        if state.cycle >= state.num_cycles:
+            self._update_cycle_status("Completed", 100, f"{state.num_cycles} cycles finished")
+            self._flash(f"Cycle test completed. Data saved to {state.log_path}")
+        else:
+            self._update_cycle_status("Stopped", (state.cycle / state.num_cycles) * 100,
+                                      f"{state.cycle} of {state.num_cycles} cycles finished",
+                                      force=True)
+
+    def _reset_cycle_controls(self):
+        """Re-enable the start button and restore timer resolution after a cycle test ends."""
+        _set_timer_resolution(False)
+        self.cycle_running = False
+        self.start_cycle_btn.config(state=tk.NORMAL)
+        self.stop_cycle_btn.config(state=tk.DISABLED)
+
+    def _update_cycle_status(self, status, progress, info, force=False):
+        """
+        Queue a cycle test status update (safe to call from any thread).
+
+        Updates arriving within 33 ms of the previous one are dropped
+        (~30 Hz), unless forced or reporting 100% progress.
+        """
+        now = time.monotonic()
+        if not force and progress < 100 and now - self._last_status_ts < 0.033:
+            return
+        self._last_status_ts = now
+        self._ui_q.put((status, progress, info))
+
+    def _drain_ui_q(self):
+        """Apply the latest queued cycle status update, then reschedule."""
+        latest = None
+        try:
+            while True:
+                latest = self._ui_q.get_nowait()
+        except queue.Empty:
+            pass
 
-        finally:
-            self.cycle_running = False
-            self.start_cycle_btn.config(state=tk.NORMAL)
-            self.stop_cycle_btn.config(state=tk.DISABLED)
+        if latest is not None:
+            status, progress, info = latest
+            self.cycle_status_label.config(text=status)
+            self.cycle_progress['value'] = progress
+            self.cycle_info_label.config(text=info)
+            self.update_idletasks()
 
-    def _update_cycle_status(self, status, progress, info):
-        """Update cycle test status (thread-safe)."""
-        self.cycle_status_label.config(text=status)
-        self.cycle_progress['value'] = progress
-        self.cycle_info_label.config(text=info)
+        self.after(50, self._drain_ui_q)
 
     def _save_cycle_config(self):
         """Save cycle test configuration."""
-        import json
         config = {
-            'num_cycles': self.cycle_params['num_cycles'].get(),
-            'pos_start': self.cycle_params['pos_start'].get(),
-            'pos_end': self.cycle_params['pos_end'].get(),
-            'dwell_start': self.cycle_params['dwell_start'].get(),
-            'dwell_end': self.cycle_params['dwell_end'].get(),
-            'cycle_delay': self.cycle_params['cycle_delay'].get()
+            'num_cycles': self._num_cycles,
+            'pos_start': self._pos_start,
+            'pos_end': self._pos_end,
+            'dwell_start': self._dwell_start,
+            'dwell_end': self._dwell_end,
+            'cycle_delay': self._cycle_delay
         }
 
         config_file = Path("data/cycle_config.json")
-        config_file.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        self._save_json(config_file, config)
 
-        messagebox.showinfo("Saved", f"Cycle config saved to {config_file}")
+        self._flash(f"Cycle config saved to {config_file}")
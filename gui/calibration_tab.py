@@ -4,12 +4,52 @@ Calibration Tab
 Sensor calibration workflows for load cells and encoders.
 """
 
+import threading
+import time
 import tkinter as tk
+import tkinter.font as tkfont
+from operator import itemgetter
 from tkinter import ttk, messagebox
+
+import numpy as np
+
+from hardware.base_controller import SENSOR_FIELDS
 from hardware.load_cell import LoadCellReader
 from hardware.encoder import EncoderReader
 
 
+# Sensor poll thread period (s), and while the tab is hidden
+_POLL_INTERVAL = 0.05
+_HIDDEN_POLL_INTERVAL = 1.0
+
+# Max seconds a button waits for a reading taken after the click
+_FRESH_TIMEOUT = 0.25
+
+# Sensor values shown by this tab; snapshots only change when these do
+_SNAPSHOT_FIELDS = ('force_tendon', 'force_tip', 'angle_joint')
+_snapshot_values = itemgetter(*(SENSOR_FIELDS.index(key) for key in _SNAPSHOT_FIELDS))
+_snapshot_raws = itemgetter(*_SNAPSHOT_FIELDS)
+
+# Max poll period multiplier while sensor reads keep failing, and min
+# seconds between logged read errors
+_MAX_ERROR_BACKOFF = 32
+_ERROR_LOG_INTERVAL = 1.0
+
+# Reading display refresh period (ms), and while the tab is hidden
+_REFRESH_MS = 100
+_HIDDEN_REFRESH_MS = 1000
+
+# Status label (text, foreground) by calibration state
+_STATUS = {
+    True: ("✓ Calibrated", "green"),
+    False: ("⚠ Not Calibrated", "orange"),
+}
+
+# Reading label formatters
+_fmt_force = "{:.2f} N".format
+_fmt_angle = "{:.1f}°".format
+
+
 class CalibrationTab(ttk.Frame):
     """Calibration interface for all sensors."""
 
@@ -19,15 +59,99 @@ class CalibrationTab(ttk.Frame):
         self.teensy = teensy
 
         # Create load cell readers
-        self.load_cell_tendon = LoadCellReader("load_cell_tendon")
-        self.load_cell_tip = LoadCellReader("load_cell_tip")
+        self.load_cell_tendon = LoadCellReader("load_cell_tendon", data_key='force_tendon')
+        self.load_cell_tip = LoadCellReader("load_cell_tip", data_key='force_tip')
 
         # Create encoder reader
         self.encoder_joint = EncoderReader("encoder_finger_joint")
 
+        # Load cell panels by key: (reader, status label attr, reading label attr)
+        self._sensors = {
+            'tendon': (self.load_cell_tendon, 'tendon_status', 'tendon_reading'),
+            'tip': (self.load_cell_tip, 'tip_status', 'tip_reading'),
+        }
+        self._weight_vars = {}  # Known weight (kg) entry variable per key
+
+        # Action buttons per sensor key ('tendon', 'tip', 'encoder'), disabled
+        # while one of that sensor's actions runs (see _run_exclusive)
+        self._buttons = {}
+        self._busy = set()
+
+        # Encoder range test window, while open (see _test_encoder_range)
+        self._range_window = None
+        self._range_min = None  # Raw angle recorded at the minimum position
+
+        # Calibration info per sensor_id, refreshed only after a calibration
+        # change marks it dirty (see _get_info)
+        self._cal_info_cache = {}
+        self._cal_dirty = {sensor.sensor_id: True for sensor in
+                           (self.load_cell_tendon, self.load_cell_tip, self.encoder_joint)}
+
+        # Conversion parameters as rows of (zero, scale), one row per
+        # _SNAPSHOT_FIELDS sensor, so all readings convert in one array op
+        # (see _convert_all). Rows are refreshed after each calibration.
+        self._param_rows = {sensor.sensor_id: row for row, sensor in
+                            enumerate((self.load_cell_tendon, self.load_cell_tip, self.encoder_joint))}
+        self._sensor_params = np.empty((len(self._param_rows), 2), dtype=np.float64)
+        for sensor in (self.load_cell_tendon, self.load_cell_tip, self.encoder_joint):
+            self._update_sensor_params(sensor)
+
+        # Last (text, foreground) applied per label, or text per StringVar
+        # name (see _set_label / _set_var)
+        self._label_state = {}
+
+        # Latest sensor reading, published by the poll thread so serial
+        # stalls never block the Tk main loop
+        self._sensor_snapshot = None
+        self._snapshot_lock = threading.Lock()
+        self._snapshot_event = threading.Event()  # Set on every new snapshot
+        # Fresh-reading requests issued by the Tk thread, and how many had
+        # been issued when the published snapshot's read started
+        self._snapshot_req = 0
+        self._snapshot_tag = 0
+        self._running = True
+        self._poll_wake = threading.Event()  # Cuts the poll thread's sleep short
+        self._consecutive_errors = 0
+        self._last_error_log = 0.0
+
+        # Pending _update_readings callback, cancelled on destroy
+        self._after_id = None
+        self._shown_snapshot = None  # Snapshot the reading labels show
+
+        # Poll and refresh slowly while another notebook tab is selected. In
+        # a notebook the tab starts hidden until it is selected (it is not
+        # even added yet); outside one it is always shown.
+        self._visible = True
+        if isinstance(parent, ttk.Notebook):
+            self._visible = (str(parent.select()) == str(self))
+            parent.bind('<<NotebookTabChanged>>', self._on_tab_changed, add='+')
+
+        threading.Thread(target=self._sensor_poll_loop, daemon=True).start()
+
+        # Fonts shared by all panels
+        self._fnt_status = tkfont.Font(family="Arial", size=12, weight="bold")
+        self._fnt_reading = tkfont.Font(family="Arial", size=14)
+
         self._create_widgets()
         self._update_displays()
 
+        # Start live reading updates
+        self._update_readings()
+
+    def _on_tab_changed(self, event):
+        """Track whether this tab is the selected notebook tab."""
+        self._visible = (event.widget.select() == str(self))
+        self._poll_wake.set()
+
+    def destroy(self):
+        """Stop the sensor poll thread and reading updates, then destroy the tab."""
+        self._running = False
+        self._poll_wake.set()
+        if self._after_id:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+        super().destroy()
+
     def _create_widgets(self):
         """Create calibration widgets."""
         # Main layout: left tendon, middle tip, right encoder
@@ -40,23 +164,17 @@ class CalibrationTab(ttk.Frame):
         encoder_frame = ttk.Frame(self)
         encoder_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        # Tendon Load Cell
-        self._create_load_cell_panel(
-            tendon_frame, "Tendon Load Cell", self.load_cell_tendon,
-            "tendon_status", "tendon_reading"
-        )
-
-        # Tip Load Cell
-        self._create_load_cell_panel(
-            tip_frame, "Fingertip Load Cell", self.load_cell_tip,
-            "tip_status", "tip_reading"
-        )
+        # Tendon and Tip Load Cells
+        self._create_load_cell_panel(tendon_frame, "Tendon Load Cell", 'tendon')
+        self._create_load_cell_panel(tip_frame, "Fingertip Load Cell", 'tip')
 
         # Joint Encoder
         self._create_encoder_panel(encoder_frame)
 
-    def _create_load_cell_panel(self, parent, title, load_cell, status_key, reading_key):
-        """Create load cell calibration panel."""
+    def _create_load_cell_panel(self, parent, title, key):
+        """Create load cell calibration panel for a self._sensors key."""
+        load_cell, status_key, reading_key = self._sensors[key]
+
         panel = ttk.LabelFrame(parent, text=title, padding=10)
         panel.pack(fill=tk.BOTH, expand=True)
 
@@ -64,36 +182,30 @@ class CalibrationTab(ttk.Frame):
         status_frame = ttk.LabelFrame(panel, text="Status", padding=10)
         status_frame.pack(fill=tk.X, pady=5)
 
-        info = load_cell.get_calibration_info()
+        info = self._get_info(load_cell)
 
-        if info['is_calibrated']:
-            status_text = f"✓ Calibrated"
-            status_color = "green"
-        else:
-            status_text = "⚠ Not Calibrated"
-            status_color = "orange"
+        status_text, status_color = _STATUS[bool(info['is_calibrated'])]
 
         status_label = ttk.Label(status_frame, text=status_text, foreground=status_color,
-                                font=("Arial", 12, "bold"))
+                                font=self._fnt_status)
         status_label.pack()
 
         # Store reference for updates
         setattr(self, status_key, status_label)
 
         # Calibration info
-        info_text = f"Zero Offset: {info['zero_offset']} counts\n"
-        info_text += f"Factor: {info['calibration_factor']:.6f} N/count\n"
-        if info['calibration_date']:
-            info_text += f"Date: {info['calibration_date'][:10]}"
-
-        ttk.Label(status_frame, text=info_text, justify=tk.LEFT).pack(pady=5)
+        info_label = ttk.Label(status_frame, text=self._load_cell_info_text(info), justify=tk.LEFT)
+        info_label.pack(pady=5)
+        setattr(self, status_key.replace('_status', '_info_label'), info_label)
 
         # Current reading
         reading_frame = ttk.LabelFrame(panel, text="Current Reading", padding=10)
         reading_frame.pack(fill=tk.X, pady=5)
 
-        reading_label = ttk.Label(reading_frame, text="0.00 N", font=("Arial", 14))
+        reading_var = tk.StringVar(value=_fmt_force(0))
+        reading_label = ttk.Label(reading_frame, textvariable=reading_var, font=self._fnt_reading)
         reading_label.pack()
+        setattr(self, reading_key + '_var', reading_var)
 
         # Store reference for updates
         setattr(self, reading_key, reading_label)
@@ -103,8 +215,7 @@ class CalibrationTab(ttk.Frame):
         proc_frame.pack(fill=tk.BOTH, expand=True, pady=5)
 
         ttk.Label(proc_frame, text="Step 1: Remove all load", justify=tk.LEFT).pack(anchor=tk.W)
-        ttk.Button(proc_frame, text="Zero Sensor",
-                  command=lambda: self._zero_load_cell(load_cell, reading_key)).pack(fill=tk.X, pady=2)
+        self._action_button(proc_frame, key, "Zero Sensor", self._zero_any, key)
 
         ttk.Separator(proc_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=5)
 
@@ -115,19 +226,19 @@ class CalibrationTab(ttk.Frame):
 
         ttk.Label(weight_frame, text="Weight (kg):").pack(side=tk.LEFT)
         weight_var = tk.DoubleVar(value=1.0)
-        ttk.Entry(weight_frame, textvariable=weight_var, width=10).pack(side=tk.LEFT, padx=5)
+        vcmd = (self.register(self._validate_positive_float), '%P')
+        ttk.Entry(weight_frame, textvariable=weight_var, width=10,
+                  validate='key', validatecommand=vcmd).pack(side=tk.LEFT, padx=5)
 
         # Store weight variable
-        setattr(self, f"{status_key}_weight", weight_var)
+        self._weight_vars[key] = weight_var
 
-        ttk.Button(proc_frame, text="Calibrate with Known Weight",
-                  command=lambda: self._calibrate_load_cell(load_cell, weight_var, status_key)).pack(fill=tk.X, pady=2)
+        self._action_button(proc_frame, key, "Calibrate with Known Weight", self._calibrate_any, key)
 
         ttk.Separator(proc_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=5)
 
         ttk.Label(proc_frame, text="Step 3: Test accuracy", justify=tk.LEFT).pack(anchor=tk.W)
-        ttk.Button(proc_frame, text="Test with Known Weight",
-                  command=lambda: self._test_load_cell(load_cell, weight_var)).pack(fill=tk.X, pady=2)
+        self._action_button(proc_frame, key, "Test with Known Weight", self._test_any, key)
 
     def _create_encoder_panel(self, parent):
         """Create encoder calibration panel."""
@@ -138,31 +249,25 @@ class CalibrationTab(ttk.Frame):
         status_frame = ttk.LabelFrame(panel, text="Status", padding=10)
         status_frame.pack(fill=tk.X, pady=5)
 
-        info = self.encoder_joint.get_calibration_info()
+        info = self._get_info(self.encoder_joint)
 
-        if info['is_calibrated']:
-            status_text = f"✓ Calibrated"
-            status_color = "green"
-        else:
-            status_text = "⚠ Not Calibrated"
-            status_color = "orange"
+        status_text, status_color = _STATUS[bool(info['is_calibrated'])]
 
         self.encoder_status = ttk.Label(status_frame, text=status_text, foreground=status_color,
-                                       font=("Arial", 12, "bold"))
+                                       font=self._fnt_status)
         self.encoder_status.pack()
 
-        info_text = f"Zero Position: {info['zero_position']} counts\n"
-        info_text += f"Resolution: {info['counts_per_revolution']} counts/rev\n"
-        if info['calibration_date']:
-            info_text += f"Date: {info['calibration_date'][:10]}"
-
-        ttk.Label(status_frame, text=info_text, justify=tk.LEFT).pack(pady=5)
+        self.encoder_info_label = ttk.Label(status_frame, text=self._encoder_info_text(info),
+                                            justify=tk.LEFT)
+        self.encoder_info_label.pack(pady=5)
 
         # Current reading
         reading_frame = ttk.LabelFrame(panel, text="Current Reading", padding=10)
         reading_frame.pack(fill=tk.X, pady=5)
 
-        self.encoder_reading = ttk.Label(reading_frame, text="0.0°", font=("Arial", 14))
+        self.encoder_reading_var = tk.StringVar(value=_fmt_angle(0))
+        self.encoder_reading = ttk.Label(reading_frame, textvariable=self.encoder_reading_var,
+                                         font=self._fnt_reading)
         self.encoder_reading.pack()
 
         # Calibration procedure
@@ -173,80 +278,138 @@ class CalibrationTab(ttk.Frame):
                  text="Move finger to reference position\n(e.g., fully extended)",
                  justify=tk.LEFT).pack(anchor=tk.W, pady=5)
 
-        ttk.Button(proc_frame, text="Set Zero Position",
-                  command=self._zero_encoder).pack(fill=tk.X, pady=2)
+        self._action_button(proc_frame, 'encoder', "Set Zero Position", self._zero_encoder)
 
         ttk.Separator(proc_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=5)
 
         ttk.Label(proc_frame, text="Test full range:", justify=tk.LEFT).pack(anchor=tk.W)
-        ttk.Button(proc_frame, text="Test Range of Motion",
-                  command=self._test_encoder_range).pack(fill=tk.X, pady=2)
+        self._action_button(proc_frame, 'encoder', "Test Range of Motion", self._test_encoder_range)
+
+    def _action_button(self, parent, key, text, handler, *args):
+        """Create a calibration action button that runs exclusively per sensor."""
+        button = ttk.Button(parent, text=text,
+                            command=lambda: self._run_exclusive(key, handler, *args))
+        button.pack(fill=tk.X, pady=2)
+        self._buttons.setdefault(key, []).append(button)
+        return button
+
+    def _run_exclusive(self, key, handler, *args):
+        """
+        Run a sensor action with that sensor's buttons disabled.
+
+        Message boxes run a nested event loop, so without this a second
+        click could start the same action (and calibration file write)
+        while the first is still waiting on its dialog.
+        """
+        if key in self._busy:
+            return
+        self._busy.add(key)
+        buttons = self._buttons.get(key, ())
+        for button in buttons:
+            button.state(['disabled'])
+        try:
+            handler(*args)
+        finally:
+            self._busy.discard(key)
+            for button in buttons:
+                button.state(['!disabled'])
 
     # Load Cell Methods
 
-    def _zero_load_cell(self, load_cell, reading_key):
-        """Zero load cell."""
+    @staticmethod
+    def _validate_positive_float(proposed):
+        """Entry validatecommand: allow only text on the way to a non-negative number."""
+        if proposed in ('', '.'):
+            return True
+        try:
+            return float(proposed) >= 0
+        except ValueError:
+            return False
+
+    def _get_weight(self, weight_var):
+        """Get the entered weight in kg, or show an error and return None."""
+        try:
+            weight_kg = weight_var.get()
+        except tk.TclError:
+            weight_kg = 0  # Empty entry
+        if weight_kg <= 0:
+            messagebox.showerror("Error", "Weight must be positive")
+            return None
+        return weight_kg
+
+    def _read_raw(self, load_cell):
+        """
+        Read a fresh raw value for a load cell.
+
+        Returns:
+            Raw ADC value, or None (after showing an error) if there is no reading
+        """
+        data = self._get_latest_snapshot(fresh=True)
+        if not data:
+            messagebox.showerror("Error", "No sensor reading - check connection and try again")
+            return None
+        return data[load_cell.data_key]
+
+    def _store_calibration(self, load_cell):
+        """Save a load cell calibration and refresh everything derived from it."""
+        load_cell.save_calibration()
+        self._cal_dirty[load_cell.sensor_id] = True
+        self._update_sensor_params(load_cell)
+
+    def _zero_any(self, key):
+        """Zero a load cell."""
+        load_cell = self._sensors[key][0]
         if not self.teensy.connected:
             messagebox.showerror("Error", "Not connected to Teensy")
             return
 
         try:
-            # Read current sensor value
-            data = self.teensy.get_sensors()
-            if data:
-                # Determine which sensor
-                if load_cell.sensor_id == "load_cell_tendon":
-                    raw_value = data['force_tendon']
-                else:
-                    raw_value = data['force_tip']
-
-                # Set zero
-                load_cell.zero(raw_value)
-                load_cell.save_calibration()
-
-                messagebox.showinfo("Success", f"Zero offset set to {raw_value} counts")
-                self._update_displays()
+            raw_value = self._read_raw(load_cell)
+            if raw_value is None:
+                return
 
+            load_cell.zero(raw_value)
+            self._store_calibration(load_cell)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to zero sensor: {str(e)}")
+            return
+
+        messagebox.showinfo("Success", f"Zero offset set to {raw_value} counts")
+        self._update_displays()
 
-    def _calibrate_load_cell(self, load_cell, weight_var, status_key):
-        """Calibrate load cell with known weight."""
+    def _calibrate_any(self, key):
+        """Calibrate a load cell with known weight."""
+        load_cell = self._sensors[key][0]
         if not self.teensy.connected:
             messagebox.showerror("Error", "Not connected to Teensy")
             return
 
-        weight_kg = weight_var.get()
-        if weight_kg <= 0:
-            messagebox.showerror("Error", "Weight must be positive")
+        weight_kg = self._get_weight(self._weight_vars[key])
+        if weight_kg is None:
             return
 
         try:
-            # Read current sensor value
-            data = self.teensy.get_sensors()
-            if data:
-                # Determine which sensor
-                if load_cell.sensor_id == "load_cell_tendon":
-                    raw_value = data['force_tendon']
-                else:
-                    raw_value = data['force_tip']
-
-                # Calibrate
-                load_cell.calibrate(raw_value, weight_kg)
-                load_cell.save_calibration()
-
-                messagebox.showinfo("Success",
-                                  f"Calibrated with {weight_kg} kg\n"
-                                  f"Factor: {load_cell.calibration_factor:.6f} N/count")
-                self._update_displays()
+            raw_value = self._read_raw(load_cell)
+            if raw_value is None:
+                return
 
+            load_cell.calibrate(raw_value, weight_kg)
+            self._store_calibration(load_cell)
         except ValueError as e:
             messagebox.showerror("Error", str(e))
+            return
         except Exception as e:
             messagebox.showerror("Error", f"Calibration failed: {str(e)}")
+            return
+
+        messagebox.showinfo("Success",
+                          f"Calibrated with {weight_kg} kg\n"
+                          f"Factor: {load_cell.calibration_factor:.6f} N/count")
+        self._update_displays()
 
-    def _test_load_cell(self, load_cell, weight_var):
+    def _test_any(self, key):
         """Test load cell accuracy."""
+        load_cell = self._sensors[key][0]
         if not self.teensy.connected:
             messagebox.showerror("Error", "Not connected to Teensy")
             return
@@ -255,37 +418,30 @@ class CalibrationTab(ttk.Frame):
             messagebox.showerror("Error", "Sensor not calibrated")
             return
 
-        weight_kg = weight_var.get()
-        if weight_kg <= 0:
-            messagebox.showerror("Error", "Weight must be positive")
+        weight_kg = self._get_weight(self._weight_vars[key])
+        if weight_kg is None:
             return
 
         try:
-            # Read current sensor value
-            data = self.teensy.get_sensors()
-            if data:
-                # Determine which sensor
-                if load_cell.sensor_id == "load_cell_tendon":
-                    raw_value = data['force_tendon']
-                else:
-                    raw_value = data['force_tip']
-
-                # Test
-                measured_kg, error_percent = load_cell.test_calibration(raw_value, weight_kg)
-
-                result = f"Expected: {weight_kg:.2f} kg\n"
-                result += f"Measured: {measured_kg:.2f} kg\n"
-                result += f"Error: {error_percent:.1f}%\n\n"
-
-                if error_percent < 5:
-                    result += "✓ Calibration OK (< 5% error)"
-                    messagebox.showinfo("Test Result", result)
-                else:
-                    result += "⚠ High error - consider recalibration"
-                    messagebox.showwarning("Test Result", result)
+            raw_value = self._read_raw(load_cell)
+            if raw_value is None:
+                return
 
+            measured_kg, error_percent = load_cell.test_calibration(raw_value, weight_kg)
         except Exception as e:
             messagebox.showerror("Error", f"Test failed: {str(e)}")
+            return
+
+        result = f"Expected: {weight_kg:.2f} kg\n"
+        result += f"Measured: {measured_kg:.2f} kg\n"
+        result += f"Error: {error_percent:.1f}%\n\n"
+
+        if error_percent < 5:
+            result += "✓ Calibration OK (< 5% error)"
+            messagebox.showinfo("Test Result", result)
+        else:
+            result += "⚠ High error - consider recalibration"
+            messagebox.showwarning("Test Result", result)
 
     # Encoder Methods
 
@@ -297,16 +453,20 @@ class CalibrationTab(ttk.Frame):
 
         try:
             # Read current encoder value
-            data = self.teensy.get_sensors()
-            if data:
-                raw_value = data['angle_joint']
+            data = self._get_latest_snapshot(fresh=True)
+            if not data:
+                messagebox.showerror("Error", "No sensor reading - check connection and try again")
+                return
+            raw_value = data['angle_joint']
 
-                # Set zero
-                self.encoder_joint.set_zero(raw_value)
-                self.encoder_joint.save_calibration()
+            # Set zero
+            self.encoder_joint.set_zero(raw_value)
+            self.encoder_joint.save_calibration()
+            self._cal_dirty[self.encoder_joint.sensor_id] = True
+            self._update_sensor_params(self.encoder_joint)
 
-                messagebox.showinfo("Success", f"Zero position set to {raw_value} counts")
-                self._update_displays()
+            messagebox.showinfo("Success", f"Zero position set to {raw_value} counts")
+            self._update_displays()
 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to set zero: {str(e)}")
@@ -321,89 +481,262 @@ class CalibrationTab(ttk.Frame):
             messagebox.showerror("Error", "Encoder not calibrated")
             return
 
-        result = messagebox.askquestion("Range Test",
-                                       "Move finger through full range.\n"
-                                       "Click Yes when at minimum position.")
-
-        if result != 'yes':
+        # Already running: bring the existing window forward
+        if self._range_window is not None:
+            self._range_window.lift()
             return
 
-        # Read minimum
-        data_min = self.teensy.get_sensors()
-        if not data_min:
-            return
-
-        result = messagebox.askquestion("Range Test",
-                                       "Now move to maximum position.\n"
-                                       "Click Yes when ready.")
-
-        if result != 'yes':
+        window = tk.Toplevel(self)
+        window.title("Range Test")
+        window.transient(self.winfo_toplevel())
+        window.protocol("WM_DELETE_WINDOW", self._close_range_test)
+        self._range_window = window
+        self._range_min = None
+
+        frame = ttk.Frame(window, padding=10)
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        self._range_prompt = tk.StringVar(value="Move finger through full range.\n"
+                                                "Click Record Min when at minimum position.")
+        ttk.Label(frame, textvariable=self._range_prompt, justify=tk.LEFT).pack(anchor=tk.W, pady=5)
+
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(fill=tk.X, pady=5)
+
+        self._range_min_btn = ttk.Button(button_frame, text="Record Min",
+                                         command=self._record_range_min)
+        self._range_min_btn.pack(side=tk.LEFT, padx=2)
+        self._range_max_btn = ttk.Button(button_frame, text="Record Max",
+                                         command=self._record_range_max, state='disabled')
+        self._range_max_btn.pack(side=tk.LEFT, padx=2)
+        self._range_close_btn = ttk.Button(button_frame, text="Cancel",
+                                           command=self._close_range_test)
+        self._range_close_btn.pack(side=tk.LEFT, padx=2)
+
+    def _record_range_min(self):
+        """Range test: record the minimum position."""
+        data = self._get_latest_snapshot(fresh=True)
+        if not data:
+            self._range_prompt.set("No sensor reading - check connection and try again.")
             return
 
-        # Read maximum
-        data_max = self.teensy.get_sensors()
-        if not data_max:
+        self._range_min = data['angle_joint']
+        self._range_prompt.set("Now move to maximum position.\n"
+                               "Click Record Max when ready.")
+        self._range_min_btn.state(['disabled'])
+        self._range_max_btn.state(['!disabled'])
+
+    def _record_range_max(self):
+        """Range test: record the maximum position and show the result."""
+        data = self._get_latest_snapshot(fresh=True)
+        if not data:
+            self._range_prompt.set("No sensor reading - check connection and try again.")
             return
 
         # Calculate range
         angle_min, angle_max, range_deg = self.encoder_joint.test_range(
-            data_min['angle_joint'], data_max['angle_joint']
+            self._range_min, data['angle_joint']
         )
 
         result = f"Minimum: {angle_min:.1f}°\n"
         result += f"Maximum: {angle_max:.1f}°\n"
-        result += f"Range: {range_deg:.1f}°\n"
+        result += f"Range: {range_deg:.1f}°"
 
-        messagebox.showinfo("Range Test Result", result)
+        self._range_prompt.set(result)
+        self._range_max_btn.state(['disabled'])
+        self._range_close_btn.config(text="Close")
+
+    def _close_range_test(self):
+        """Close the range test window."""
+        if self._range_window is not None:
+            self._range_window.destroy()
+            self._range_window = None
 
     # Update Methods
 
-    def _update_displays(self):
-        """Update all status displays."""
-        # Tendon load cell
-        info = self.load_cell_tendon.get_calibration_info()
-        if info['is_calibrated']:
-            self.tendon_status.config(text="✓ Calibrated", foreground="green")
+    def _update_sensor_params(self, sensor):
+        """Copy a sensor's calibration into its _sensor_params row."""
+        row = self._sensor_params[self._param_rows[sensor.sensor_id]]
+        if isinstance(sensor, LoadCellReader):
+            row[:] = (sensor.zero_offset, sensor.calibration_factor)
         else:
-            self.tendon_status.config(text="⚠ Not Calibrated", foreground="orange")
+            row[:] = (sensor.zero_position, 360.0 / sensor.counts_per_revolution)
+
+    def _convert_all(self, raws):
+        """
+        Convert raw values to engineering units in one vectorized step.
+
+        Args:
+            raws: Raw values in _SNAPSHOT_FIELDS order; a trailing axis of
+                samples (shape (3, N)) converts N readings at once
+
+        Returns:
+            Array of (tendon force N, tip force N, joint angle deg)
+        """
+        params = self._sensor_params
+        raws = np.asarray(raws, dtype=np.float64)
+        if raws.ndim > 1:
+            params = params[:, :, np.newaxis]
+
+        values = (raws - params[:, 0]) * params[:, 1]
+        values[2] %= 360.0  # Encoder wraps once per revolution
+        return values
+
+    def _get_info(self, sensor):
+        """Get a sensor's calibration info, cached until marked dirty."""
+        sensor_id = sensor.sensor_id
+        if self._cal_dirty[sensor_id]:
+            self._cal_info_cache[sensor_id] = sensor.get_calibration_info()
+            self._cal_dirty[sensor_id] = False
+        return self._cal_info_cache[sensor_id]
+
+    @staticmethod
+    def _load_cell_info_text(info):
+        """Format load cell calibration info for display."""
+        info_text = f"Zero Offset: {info['zero_offset']} counts\n"
+        info_text += f"Factor: {info['calibration_factor']:.6f} N/count\n"
+        if info['calibration_date']:
+            info_text += f"Date: {info['calibration_date'][:10]}"
+        return info_text
 
-        # Tip load cell
-        info = self.load_cell_tip.get_calibration_info()
-        if info['is_calibrated']:
-            self.tip_status.config(text="✓ Calibrated", foreground="green")
-        else:
-            self.tip_status.config(text="⚠ Not Calibrated", foreground="orange")
+    @staticmethod
+    def _encoder_info_text(info):
+        """Format encoder calibration info for display."""
+        info_text = f"Zero Position: {info['zero_position']} counts\n"
+        info_text += f"Resolution: {info['counts_per_revolution']} counts/rev\n"
+        if info['calibration_date']:
+            info_text += f"Date: {info['calibration_date'][:10]}"
+        return info_text
 
-        # Encoder
-        info = self.encoder_joint.get_calibration_info()
-        if info['is_calibrated']:
-            self.encoder_status.config(text="✓ Calibrated", foreground="green")
+    def _set_label(self, label, text, foreground=None):
+        """Configure a label only if its text or color would change."""
+        state = (text, foreground)
+        if self._label_state.get(label) == state:
+            return
+        self._label_state[label] = state
+
+        if foreground is None:
+            label.config(text=text)
         else:
-            self.encoder_status.config(text="⚠ Not Calibrated", foreground="orange")
+            label.config(text=text, foreground=foreground)
 
-        # Start live reading updates
-        self._update_readings()
+    def _set_var(self, var, text):
+        """Set a StringVar only if its text would change."""
+        key = str(var)  # Tcl variable name (Variables are unhashable)
+        if self._label_state.get(key) == text:
+            return
+        self._label_state[key] = text
+        var.set(text)
+
+    def _update_displays(self):
+        """Update all status displays."""
+        self._shown_snapshot = None  # Re-render readings with the new calibration
+
+        for sensor, status_label, info_label, info_text in (
+                (self.load_cell_tendon, self.tendon_status, self.tendon_info_label, self._load_cell_info_text),
+                (self.load_cell_tip, self.tip_status, self.tip_info_label, self._load_cell_info_text),
+                (self.encoder_joint, self.encoder_status, self.encoder_info_label, self._encoder_info_text)):
+            info = self._get_info(sensor)
+
+            self._set_label(status_label, *_STATUS[bool(info['is_calibrated'])])
+
+            self._set_label(info_label, info_text(info))
+
+    def _sensor_poll_loop(self):
+        """Poll thread: read sensors into the shared snapshot (no Tk calls here)."""
+        buf = [None] * len(SENSOR_FIELDS)  # Reused by every read
+        values = data = None
+
+        while self._running:
+            tag = self._snapshot_req  # Requests this read satisfies
+            read_ok = False
+            if self.teensy.connected:
+                try:
+                    read_ok = self.teensy.fill_sensors(buf)
+                    self._consecutive_errors = 0
+                except Exception as e:
+                    # Shown as a missing reading; back off while reads keep failing
+                    self._consecutive_errors += 1
+                    now = time.monotonic()
+                    if now - self._last_error_log >= _ERROR_LOG_INTERVAL:
+                        self._last_error_log = now
+                        print(f"Calibration sensor read failed "
+                              f"({self._consecutive_errors} in a row): {e}")
+
+            # Publish a new snapshot object only when a shown value changed,
+            # so _update_readings can skip unchanged readings by identity
+            if not read_ok:
+                values = data = None
+            elif _snapshot_values(buf) != values:
+                values = _snapshot_values(buf)
+                data = dict(zip(_SNAPSHOT_FIELDS, values))
+
+            with self._snapshot_lock:
+                self._sensor_snapshot = data
+                self._snapshot_tag = tag
+            self._snapshot_event.set()
+
+            interval = _POLL_INTERVAL if self._visible else _HIDDEN_POLL_INTERVAL
+            if self._consecutive_errors:
+                interval *= min(_MAX_ERROR_BACKOFF, 2 ** self._consecutive_errors)
+            self._poll_wake.wait(interval)
+            self._poll_wake.clear()
+
+    def _get_latest_snapshot(self, fresh=False):
+        """
+        Get the latest sensor reading from the poll thread.
+
+        Args:
+            fresh: Wait (up to _FRESH_TIMEOUT) for a reading started after this call
+
+        Returns:
+            Sensor dict, or None if no (fresh) reading is available
+        """
+        if not fresh:
+            with self._snapshot_lock:
+                return self._sensor_snapshot
+
+        self._snapshot_req += 1
+        req = self._snapshot_req
+        deadline = time.monotonic() + _FRESH_TIMEOUT
+        self._poll_wake.set()
+
+        while True:
+            self._snapshot_event.clear()
+            with self._snapshot_lock:
+                if self._snapshot_tag >= req:
+                    return self._sensor_snapshot
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None  # Never return a reading from before the click
+            self._snapshot_event.wait(remaining)
 
     def _update_readings(self):
-        """Update live sensor readings."""
-        if self.teensy.connected:
-            try:
-                data = self.teensy.get_sensors()
-                if data:
-                    # Tendon force
-                    force_tendon = self.load_cell_tendon.convert_to_force(data['force_tendon'])
-                    self.tendon_reading.config(text=f"{force_tendon:.2f} N")
-
-                    # Tip force
-                    force_tip = self.load_cell_tip.convert_to_force(data['force_tip'])
-                    self.tip_reading.config(text=f"{force_tip:.2f} N")
-
-                    # Joint angle
-                    angle = self.encoder_joint.convert_to_angle(data['angle_joint'])
-                    self.encoder_reading.config(text=f"{angle:.1f}°")
-
-            except Exception as e:
-                pass  # Silently handle errors
-
-        # Schedule next update
-        self.after(100, self._update_readings)  # 10 Hz
+        """Update live sensor readings from the latest snapshot."""
+        delay = _REFRESH_MS if self._visible else _HIDDEN_REFRESH_MS
+
+        # Nothing to show
+        if not self._visible and not self.teensy.connected:
+            self._after_id = self.after(delay, self._update_readings)
+            return
+
+        data = self._get_latest_snapshot()
+
+        try:
+            # Same snapshot object as last tick: labels are already current
+            if data and data is not self._shown_snapshot:
+                force_tendon, force_tip, angle = self._convert_all(_snapshot_raws(data)).tolist()
+
+                # Compute all three readings, then apply them in one block
+                tendon_text = _fmt_force(force_tendon)
+                tip_text = _fmt_force(force_tip)
+                angle_text = _fmt_angle(angle)
+
+                self._set_var(self.tendon_reading_var, tendon_text)
+                self._set_var(self.tip_reading_var, tip_text)
+                self._set_var(self.encoder_reading_var, angle_text)
+            self._shown_snapshot = data
+        finally:
+            # Schedule next update
+            self._after_id = self.after(delay, self._update_readings)
@@ -6,10 +6,80 @@ Specialized tests for robotic finger mechanisms: range of motion, grip force, pr
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from pathlib import Path
+import os
+import queue
 import threading
 import time
-from datetime import datetime
+
+import numpy as np
+
+from data.session import new_session_csv_path
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+# Unit scale factors (multiplication instead of division in sample loops)
+_MILLI = 1e-3  # mA -> A, mN -> N
+_GRAVITY_INV = 1.0 / 9.81  # N -> kg
+
+# CSV columns per test; rows are logged as tuples in this order
+_ROM_HEADERS = ('direction', 'position', 'angle_joint', 'force_tendon')
+_FORCE_HEADERS = ('torque_cmd', 'current', 'force_tip', 'efficiency')
+_GRIP_HEADERS = ('time_sec', 'force_tip', 'current', 'position')
+_PRECISION_HEADERS = ('target_force', 'achieved_force', 'error', 'overshoot')
+_REPEATABILITY_HEADERS = ('trial', 'target_pos', 'actual_pos', 'error')
+
+# Max result text chunks queued for the Tk thread before new text is dropped
+_MAX_QUEUED_LINES = 10_000
+
+# Max lines kept in the results display
+_MAX_RESULT_LINES = 2000
+
+# Per-sample result line formatters
+_fmt_torque_line = "Torque: {} mNm → Force: {:.2f} N, Current: {:.2f} A\n".format
+_fmt_grip_line = "T+{}s: Force = {:.2f} N\n".format
+_fmt_trial_line = "Trial {}: {} counts (error: {})\n".format
+
+
+def _jit(func):
+    """Compile func with Numba when available, otherwise return it unchanged."""
+    if HAS_NUMBA:
+        return njit(cache=True)(func)
+    return func
+
+
+@_jit
+def _compute_force_metrics(current_raw, force_raw):
+    """
+    Convert a force-test sample to engineering units and estimate efficiency.
+
+    Args:
+        current_raw: Motor current (mA)
+        force_raw: Fingertip force (mN)
+
+    Returns:
+        (current_A, force_N, efficiency_percent) tuple
+    """
+    current = current_raw * _MILLI
+    force = force_raw * _MILLI
+
+    power_elec = current * 24.0  # V * A
+    power_mech = force * 0.001  # Simplified
+    efficiency = (power_mech / power_elec * 100.0) if power_elec > 0.0 else 0.0
+    return current, force, efficiency
+
+
+# Compile JIT helpers now rather than stalling the first test that uses them
+# (set TEENSY_SKIP_WARMUP=1 to skip, e.g. for faster startup while developing)
+if HAS_NUMBA and os.environ.get('TEENSY_SKIP_WARMUP') != '1':
+    try:
+        _compute_force_metrics(0.0, 0.0)
+    except Exception as e:
+        print(f"Numba warm-up failed: {e}")
 
 
 class FingerTestingTab(ttk.Frame):
@@ -23,6 +93,7 @@ class FingerTestingTab(ttk.Frame):
 
         self.test_running = False
         self.test_thread = None
+        self._stop_event = threading.Event()  # Set to stop the running test (see _wait)
 
         # Finger configuration
         self.finger_config = {
@@ -31,8 +102,17 @@ class FingerTestingTab(ttk.Frame):
             'spool_radius': tk.DoubleVar(value=10.0)  # mm
         }
 
+        # Result text and status from the test thread, applied to the widgets
+        # by _flush_ui() on the Tk thread
+        self._ui_queue = queue.SimpleQueue()
+        self._log_truncated = False  # Set while result text is being dropped
+        self._status_pending = None  # Latest (status, progress, info); older ones are dropped
+        self._status_shown = None
+
         self._create_widgets()
 
+        self.after(50, self._flush_ui)
+
     def _create_widgets(self):
         """Create finger testing widgets."""
         # Main layout
@@ -133,11 +213,9 @@ class FingerTestingTab(ttk.Frame):
         """Execute ROM test."""
         self._log_result("=== RANGE OF MOTION TEST ===\n\n")
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_path = Path("data/sessions") / f"finger_rom_{timestamp}.csv"
+        log_path = new_session_csv_path('finger_rom')
 
-        headers = ['direction', 'position', 'angle_joint', 'force_tendon']
-        self.logger.start_logging(log_path, headers, metadata={
+        self.logger.start_logging(log_path, list(_ROM_HEADERS), metadata={
             'test_type': 'finger_rom',
             'num_joints': self.finger_config['num_joints'].get()
         })
@@ -147,40 +225,39 @@ class FingerTestingTab(ttk.Frame):
         self._log_result("Extending finger to full extension...\n")
 
         self.teensy.set_position(0)
-        time.sleep(2)
+        if not self._wait(2):
+            self.logger.stop_logging()
+            self._update_status("Stopped", 0)
+            return
 
-        data = self.teensy.get_sensors()
+        data = self.teensy.read_frame()
         if data:
-            pos_extended = data['position']
-            angle_extended = data['angle_joint'] / 100.0  # Convert to degrees
+            pos_extended = data.position
+            angle_extended = data.angle_joint / 100.0  # Convert to degrees
             self._log_result(f"  Extended position: {pos_extended} counts, Angle: {angle_extended:.1f}°\n")
 
-            self.logger.log({
-                'direction': 'extended',
-                'position': pos_extended,
-                'angle_joint': angle_extended,
-                'force_tendon': data['force_tendon'] / 1000.0
-            })
+            self.logger.log_row(('extended', pos_extended, angle_extended,
+                                 data.force_tendon * _MILLI))
 
         # Flex fully (with force limit)
         self._update_status("Flexing to limit", 75)
         self._log_result("\nFlexing finger to full flexion...\n")
 
         self.teensy.set_torque(2000)  # Apply torque until limit
-        time.sleep(3)
+        if not self._wait(3):
+            self.teensy.set_torque(0)
+            self.logger.stop_logging()
+            self._update_status("Stopped", 0)
+            return
 
-        data = self.teensy.get_sensors()
+        data = self.teensy.read_frame()
         if data:
-            pos_flexed = data['position']
-            angle_flexed = data['angle_joint'] / 100.0
+            pos_flexed = data.position
+            angle_flexed = data.angle_joint / 100.0
             self._log_result(f"  Flexed position: {pos_flexed} counts, Angle: {angle_flexed:.1f}°\n")
 
-            self.logger.log({
-                'direction': 'flexed',
-                'position': pos_flexed,
-                'angle_joint': angle_flexed,
-                'force_tendon': data['force_tendon'] / 1000.0
-            })
+            self.logger.log_row(('flexed', pos_flexed, angle_flexed,
+                                 data.force_tendon * _MILLI))
 
         # Calculate ROM
         rom = abs(pos_flexed - pos_extended)
@@ -210,16 +287,14 @@ class FingerTestingTab(ttk.Frame):
 
     def _force_test_worker(self):
         """Execute force test."""
-        self._log_result("=== FINGERTIP FORCE TEST ===\n")
-        self._log_result(f"Target: {self.target_force.get()} N (1.2 kg = 11.8 N)\n\n")
-
         target = self.target_force.get()
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_path = Path("data/sessions") / f"finger_force_{timestamp}.csv"
+        self._log_result("=== FINGERTIP FORCE TEST ===\n")
+        self._log_result(f"Target: {target} N (1.2 kg = 11.8 N)\n\n")
+
+        log_path = new_session_csv_path('finger_force')
 
-        headers = ['torque_cmd', 'current', 'force_tip', 'efficiency']
-        self.logger.start_logging(log_path, headers, metadata={
+        self.logger.start_logging(log_path, list(_FORCE_HEADERS), metadata={
             'test_type': 'finger_force',
             'target_force': target
         })
@@ -228,37 +303,35 @@ class FingerTestingTab(ttk.Frame):
         max_torque = 3000  # mNm
         steps = 20
 
-        for i in range(steps + 1):
-            if not self.test_running:
-                break
+        # Loop-invariant lookups
+        read_frame = self.teensy.read_frame
+        set_torque = self.teensy.set_torque
+        log_row = self.logger.log_row
+        log_result = self._log_result
+        update_status = self._update_status
+        wait = self._wait
 
-            torque = int((i / steps) * max_torque)
-            self._update_status(f"Applying {torque} mNm", (i / steps) * 100)
+        # Torque schedule for the whole ramp (mNm)
+        torques = np.linspace(0, max_torque, steps + 1).astype(np.int32).tolist()
 
-            self.teensy.set_torque(torque)
-            time.sleep(0.5)
+        for i, torque in enumerate(torques):
+            update_status(f"Applying {torque} mNm", (i / steps) * 100)
 
-            data = self.teensy.get_sensors()
-            if data:
-                current = data['current'] / 1000.0
-                force_tip = data['force_tip'] / 1000.0
+            set_torque(torque)
+            if not wait(0.5):
+                break
 
-                # Calculate efficiency
-                power_elec = current * 24  # V * A
-                power_mech = force_tip * 0.001  # Simplified
-                efficiency = (power_mech / power_elec * 100) if power_elec > 0 else 0
+            data = read_frame()
+            if data:
+                current, force_tip, efficiency = _compute_force_metrics(
+                    float(data.current), float(data.force_tip))
 
-                self.logger.log({
-                    'torque_cmd': torque,
-                    'current': current,
-                    'force_tip': force_tip,
-                    'efficiency': efficiency
-                })
+                log_row((torque, current, force_tip, efficiency))
 
-                self._log_result(f"Torque: {torque} mNm → Force: {force_tip:.2f} N, Current: {current:.2f} A\n")
+                log_result(_fmt_torque_line(torque, force_tip, current))
 
                 if force_tip >= target:
-                    self._log_result(f"\n✓ Target force {target}N achieved!\n")
+                    log_result(f"\n✓ Target force {target}N achieved!\n")
                     break
 
         self.teensy.set_torque(0)
@@ -287,41 +360,53 @@ class FingerTestingTab(ttk.Frame):
         self._log_result(f"Target Force: {force} N\n")
         self._log_result(f"Duration: {duration} seconds\n\n")
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_path = Path("data/sessions") / f"finger_grip_{timestamp}.csv"
+        log_path = new_session_csv_path('finger_grip')
 
-        headers = ['time_sec', 'force_tip', 'current', 'position']
-        self.logger.start_logging(log_path, headers)
+        self.logger.start_logging(log_path, list(_GRIP_HEADERS))
 
         # Apply grip force
         torque_cmd = int(force * 10)  # Convert to torque
         self.teensy.set_torque(torque_cmd)
 
-        start_time = time.time()
-        self._log_result("Applying grip force...\n\n")
+        # Loop-invariant lookups
+        read_frame = self.teensy.read_frame
+        log_row = self.logger.log_row
+        log_result = self._log_result
+        update_status = self._update_status
+        wait = self._wait
+        stopped = self._stop_event.is_set
+        now = time.monotonic  # Immune to wall-clock adjustments
+
+        start_time = now()
+        deadline = start_time  # Sample times advance by a fixed period from here
+        log_result("Applying grip force...\n\n")
 
-        while self.test_running:
-            elapsed = time.time() - start_time
+        next_log_t = 5.0  # Next force summary line (s)
+        next_status_t = 0.0  # Next progress update (s)
+
+        while not stopped():
+            elapsed = now() - start_time
             if elapsed >= duration:
                 break
 
-            data = self.teensy.get_sensors()
+            data = read_frame()
             if data:
-                force_tip = data['force_tip'] / 1000.0
-                current = data['current'] / 1000.0
+                force_tip = data.force_tip * _MILLI
+                current = data.current * _MILLI
+
+                log_row((elapsed, force_tip, current, data.position))
 
-                self.logger.log({
-                    'time_sec': elapsed,
-                    'force_tip': force_tip,
-                    'current': current,
-                    'position': data['position']
-                })
+                if elapsed >= next_log_t:
+                    log_result(_fmt_grip_line(int(elapsed), force_tip))
+                    next_log_t += 5.0
 
-                if int(elapsed) % 5 == 0:
-                    self._log_result(f"T+{int(elapsed)}s: Force = {force_tip:.2f} N\n")
+            if elapsed >= next_status_t:
+                update_status("Holding grip", (elapsed / duration) * 100)
+                next_status_t += 0.25
 
-            self._update_status("Holding grip", (elapsed / duration) * 100)
-            time.sleep(0.1)
+            # Sleep until the next sample time, so read/log time doesn't add drift
+            deadline += 0.1
+            wait(max(0.0, deadline - now()))
 
         self.teensy.set_torque(0)
         self.logger.stop_logging()
@@ -344,37 +429,28 @@ class FingerTestingTab(ttk.Frame):
         self._log_result("=== PRECISION GRASP TEST ===\n\n")
         self._log_result("Testing controlled low-force grasping (0.5 - 2.0 N)\n\n")
 
-        forces = [0.5, 1.0, 1.5, 2.0]  # N
-
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_path = Path("data/sessions") / f"finger_precision_{timestamp}.csv"
+        forces = np.array([0.5, 1.0, 1.5, 2.0])  # N
+        torques = (forces * 10).astype(np.int32)  # Torque command per target force
 
-        headers = ['target_force', 'achieved_force', 'error', 'overshoot']
-        self.logger.start_logging(log_path, headers)
+        log_path = new_session_csv_path('finger_precision')
 
-        for i, target in enumerate(forces):
-            if not self.test_running:
-                break
+        self.logger.start_logging(log_path, list(_PRECISION_HEADERS))
 
+        for i, (target, torque) in enumerate(zip(forces.tolist(), torques.tolist())):
             self._update_status(f"Testing {target}N", (i / len(forces)) * 100)
             self._log_result(f"Target: {target} N\n")
 
-            torque = int(target * 10)
             self.teensy.set_torque(torque)
-            time.sleep(1)
+            if not self._wait(1):
+                break
 
-            data = self.teensy.get_sensors()
+            data = self.teensy.read_frame()
             if data:
-                achieved = data['force_tip'] / 1000.0
+                achieved = data.force_tip * _MILLI
                 error = abs(achieved - target)
                 overshoot = max(0, achieved - target)
 
-                self.logger.log({
-                    'target_force': target,
-                    'achieved_force': achieved,
-                    'error': error,
-                    'overshoot': overshoot
-                })
+                self.logger.log_row((target, achieved, error, overshoot))
 
                 self._log_result(f"  Achieved: {achieved:.2f} N, Error: {error:.2f} N\n")
 
@@ -403,14 +479,12 @@ class FingerTestingTab(ttk.Frame):
         max_torque = 3000
         self.teensy.set_torque(max_torque)
 
-        time.sleep(2)
-
-        data = self.teensy.get_sensors()
+        data = self.teensy.read_frame() if self._wait(2) else None
         if data:
-            max_force = data['force_tip'] / 1000.0
-            current = data['current'] / 1000.0
+            max_force = data.force_tip * _MILLI
+            current = data.current * _MILLI
 
-            self._log_result(f"Maximum Force: {max_force:.2f} N ({max_force/9.81:.2f} kg)\n")
+            self._log_result(f"Maximum Force: {max_force:.2f} N ({max_force * _GRAVITY_INV:.2f} kg)\n")
             self._log_result(f"Current Draw: {current:.2f} A\n")
 
             if max_force >= 11.8:  # 1.2 kg target
@@ -442,53 +516,51 @@ class FingerTestingTab(ttk.Frame):
         self._log_result(f"Repetitions: {reps}\n")
         self._log_result(f"Target Position: {target_pos} counts\n\n")
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_path = Path("data/sessions") / f"finger_repeatability_{timestamp}.csv"
+        log_path = new_session_csv_path('finger_repeatability')
 
-        headers = ['trial', 'target_pos', 'actual_pos', 'error']
-        self.logger.start_logging(log_path, headers)
+        self.logger.start_logging(log_path, list(_REPEATABILITY_HEADERS))
 
-        positions = []
+        # Measured positions and errors, filled up to `count` trials
+        positions = np.empty(max(reps, 0), dtype=np.int64)
+        errors = np.empty(max(reps, 0), dtype=np.int64)
+        count = 0
 
         for i in range(reps):
-            if not self.test_running:
-                break
-
             self._update_status(f"Trial {i+1}/{reps}", (i / reps) * 100)
 
             # Reset
             self.teensy.set_position(0)
-            time.sleep(0.5)
+            if not self._wait(0.5):
+                break
 
             # Move to target
             self.teensy.set_position(target_pos)
-            time.sleep(1)
+            if not self._wait(1):
+                break
 
-            data = self.teensy.get_sensors()
+            data = self.teensy.read_frame()
             if data:
-                actual = data['position']
+                actual = data.position
                 error = abs(actual - target_pos)
-                positions.append(actual)
+                positions[count] = actual
+                errors[count] = error
+                count += 1
 
-                self.logger.log({
-                    'trial': i + 1,
-                    'target_pos': target_pos,
-                    'actual_pos': actual,
-                    'error': error
-                })
+                self.logger.log_row((i + 1, target_pos, actual, error))
 
-                self._log_result(f"Trial {i+1}: {actual} counts (error: {error})\n")
+                self._log_result(_fmt_trial_line(i + 1, actual, error))
 
         # Calculate statistics
-        if positions:
-            import statistics
-            mean = statistics.mean(positions)
-            stdev = statistics.stdev(positions) if len(positions) > 1 else 0
+        if count:
+            valid = positions[:count]
+            mean = valid.mean()
+            stdev = valid.std(ddof=1) if count > 1 else 0.0
 
             self._log_result(f"\n--- Statistics ---\n")
             self._log_result(f"Mean: {mean:.1f} counts\n")
             self._log_result(f"Std Dev: {stdev:.1f} counts\n")
             self._log_result(f"Repeatability: ±{stdev:.1f} counts\n")
+            self._log_result(f"95th Percentile Error: {np.percentile(errors[:count], 95):.1f} counts\n")
 
         self.teensy.set_position(0)
         self.logger.stop_logging()
@@ -511,28 +583,93 @@ class FingerTestingTab(ttk.Frame):
             return
 
         self.test_running = True
+        self._stop_event.clear()
         self.stop_btn.config(state=tk.NORMAL)
+        self._ui_queue = queue.SimpleQueue()  # Drop text left from the previous test
+        self._log_truncated = False
         self.results_text.delete(1.0, tk.END)
 
-        self.test_thread = threading.Thread(target=worker_func)
+        self.test_thread = threading.Thread(target=self._run_worker, args=(worker_func,))
         self.test_thread.daemon = True
         self.test_thread.start()
 
+    def _run_worker(self, worker_func):
+        """Test thread: run a test worker, then mark the test finished."""
+        was_logging = self.logger.is_active()
+        try:
+            worker_func()
+        except Exception as e:
+            self._log_result(f"\n✗ Test failed: {e}\n")
+            self._update_status("Failed", 0)
+            try:
+                self.teensy.set_torque(0)
+            except Exception:
+                pass  # Best effort; the failure is already reported
+        finally:
+            # Close (and flush) a log the worker opened but did not close
+            if not was_logging and self.logger.is_active():
+                self.logger.stop_logging()
+            self.test_running = False
+
+    def _wait(self, seconds):
+        """
+        Sleep in the test thread, waking immediately if the test is stopped.
+
+        Returns:
+            True if the full time elapsed, False if the test was stopped
+        """
+        return not self._stop_event.wait(seconds)
+
     def _stop_test(self):
         """Stop running test."""
-        self.test_running = False
+        self._stop_event.set()
         self.status_label.config(text="Stopping...", foreground="orange")
 
     def _update_status(self, status, progress=0, info=""):
-        """Update test status display."""
-        self.status_label.config(text=status)
-        self.progress['value'] = progress
-        self.info_label.config(text=info)
+        """Queue a test status update (safe to call from the test thread)."""
+        self._status_pending = (status, progress, info)
 
-        if not self.test_running:
+    def _log_result(self, text):
+        """Queue text for the results display (safe to call from the test thread)."""
+        # Bound the backlog if the Tk loop stalls; mark the gap once
+        if self._ui_queue.qsize() > _MAX_QUEUED_LINES:
+            if not self._log_truncated:
+                self._log_truncated = True
+                self._ui_queue.put("[log truncated]\n")
+            return
+        self._ui_queue.put(text)
+
+    def _flush_ui(self):
+        """Apply queued result text and the latest status, then reschedule."""
+        chunks = []
+        try:
+            while True:
+                chunks.append(self._ui_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        if chunks:
+            self._log_truncated = False
+            results_text = self.results_text
+            results_text.insert(tk.END, ''.join(chunks))
+
+            # Keep only the newest lines; the CSV log holds the full record
+            n_lines = int(results_text.index('end-1c').split('.')[0])
+            if n_lines > _MAX_RESULT_LINES:
+                results_text.delete('1.0', f'{n_lines - _MAX_RESULT_LINES}.0')
+
+            results_text.see(tk.END)
+
+        # Read once; never cleared, so an update can't be lost to a race
+        pending = self._status_pending
+        if pending is not self._status_shown:
+            self._status_shown = pending
+            status, progress, info = pending
+            self.status_label.config(text=status)
+            self.progress['value'] = progress
+            self.info_label.config(text=info)
+
+        if not self.test_running and str(self.stop_btn['state']) != tk.DISABLED:
             self.stop_btn.config(state=tk.DISABLED)
 
-    def _log_result(self, text):
-        """Append text to results display."""
-        self.results_text.insert(tk.END, text)
-        self.results_text.see(tk.END)
+        self.after(50, self._flush_ui)
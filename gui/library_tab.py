@@ -6,9 +6,19 @@ GUI for selecting, configuring, and running automated tests.
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
+import functools
+import logging
+import queue
 import threading
 from typing import Dict, Any
 
+logger = logging.getLogger(__name__)
+
+# Results text is trimmed by _TRIM_RESULT_LINES oldest lines once it exceeds
+# _MAX_RESULT_LINES (the session CSV holds the full record)
+_MAX_RESULT_LINES = 5000
+_TRIM_RESULT_LINES = 2000
+
 
 class TestLibraryTab(ttk.Frame):
     """Test Library tab for automated testing."""
@@ -28,8 +38,53 @@ class TestLibraryTab(ttk.Frame):
         self.test_thread = None
         self.current_test = None
 
+        # Selected test and its (name, label text, definition) parameter rows
+        # (see _on_test_selected)
+        self._cached_test = None
+        self._param_rows = []
+
+        # Parameter rows per test id, built on first selection
+        self._label_cache = {}
+
+        # Debounced duration estimate: pending after() id and last estimated config
+        self._dur_after = None
+        self._last_dur_key = None
+
+        # Initial value of each parameter variable, for _reset_params()
+        self._defaults = {}
+        self._bulk_update = False  # Suppresses per-variable estimates during a reset
+
+        # Current parameter values, kept up to date by variable traces so
+        # _get_config() needs no Tcl calls; names whose entry text is not a
+        # valid value are listed in _invalid_params
+        self._config_mirror = {}
+        self._invalid_params = set()
+
+        # Parameter widgets are recycled across selections: unused ones wait
+        # in a pool per kind, shown ones are listed as (kind, widget)
+        self._widget_pools = {kind: [] for kind in ('label', 'desc', 'number', 'check', 'str')}
+        self._shown_widgets = []
+
+        # Progress reported from the test thread, applied by _drain_progress()
+        # on the Tk thread
+        self._progress_q = queue.Queue()
+        # (handler, argument) for the test outcome, posted once by the test thread
+        self._outcome_q = queue.SimpleQueue()
+
         self._create_widgets()
 
+        self._drain_after_id = self.after(50, self._drain_progress)
+
+    def destroy(self):
+        """Stop draining progress updates, then destroy the tab."""
+        if self._drain_after_id:
+            self.after_cancel(self._drain_after_id)
+            self._drain_after_id = None
+        if self._dur_after:
+            self.after_cancel(self._dur_after)
+            self._dur_after = None
+        super().destroy()
+
     def _create_widgets(self):
         """Create GUI widgets."""
         # Main layout: left catalog + right config
@@ -61,18 +116,18 @@ class TestLibraryTab(ttk.Frame):
         scrollbar = ttk.Scrollbar(list_frame)
         scrollbar.pack(side='right', fill='y')
 
-        # Listbox for tests
+        # Populate test list
+        self._load_catalog()
+
+        # Listbox for tests, filled in one Tcl call through its list variable
+        # (the listbox only draws the rows in view)
+        self._names_var = tk.StringVar(value=self._names)
         self.test_listbox = tk.Listbox(list_frame, yscrollcommand=scrollbar.set,
+                                       listvariable=self._names_var,
                                        selectmode='single', font=('Arial', 10))
         self.test_listbox.pack(side='left', fill='both', expand=True)
         scrollbar.config(command=self.test_listbox.yview)
 
-        # Populate test list
-        self.test_data = []
-        for test_id, name, description in self.registry.get_test_list():
-            self.test_listbox.insert('end', name)
-            self.test_data.append({'id': test_id, 'name': name, 'description': description})
-
         self.test_listbox.bind('<<ListboxSelect>>', self._on_test_selected)
 
         # Description panel
@@ -87,6 +142,14 @@ class TestLibraryTab(ttk.Frame):
         self.duration_label = ttk.Label(parent, text="Estimated duration: --")
         self.duration_label.pack(pady=5)
 
+    def _load_catalog(self):
+        """Read the registry's test list into parallel id/name/description lists by listbox row."""
+        self._ids, self._names, self._descs = [], [], []
+        for test_id, name, description in self.registry.get_test_list():
+            self._ids.append(test_id)
+            self._names.append(name)
+            self._descs.append(description)
+
     def _create_config_panel(self, parent):
         """Create configuration panel."""
         ttk.Label(parent, text="Test Configuration", font=('Arial', 12, 'bold')).pack(pady=5)
@@ -146,13 +209,16 @@ class TestLibraryTab(ttk.Frame):
             return
 
         idx = selection[0]
-        test_info = self.test_data[idx]
-        self.selected_test_id = test_info['id']
+        self.selected_test_id = self._ids[idx]
+
+        # Fetch the test once per selection and its parameter rows once per test
+        self._cached_test = self.registry.get_test(self.selected_test_id)
+        self._param_rows = self._get_param_rows(self.selected_test_id, self._cached_test)
 
         # Update description
         self.description_text.config(state='normal')
         self.description_text.delete('1.0', 'end')
-        self.description_text.insert('1.0', test_info['description'])
+        self.description_text.insert('1.0', self._descs[idx])
         self.description_text.config(state='disabled')
 
         # Generate parameter widgets
@@ -161,90 +227,178 @@ class TestLibraryTab(ttk.Frame):
         # Update estimated duration
         self._update_duration_estimate()
 
+    def _get_param_rows(self, test_id: str, test) -> list:
+        """
+        Get a test's parameters with their display labels, cached per test id.
+
+        Args:
+            test_id: Test identifier
+            test: Test instance (or None)
+
+        Returns:
+            List of (param_name, label_text, param_def) tuples in definition order
+        """
+        rows = self._label_cache.get(test_id)
+        if rows is None:
+            rows = []
+            if test:
+                for param_name, param_def in test.get_parameters().items():
+                    label_text = param_name.replace('_', ' ').title()
+                    if 'unit' in param_def:
+                        label_text += f" ({param_def['unit']})"
+                    rows.append((param_name, label_text, param_def))
+                self._label_cache[test_id] = rows
+        return rows
+
+    def _new_param_widget(self, kind: str):
+        """Create a parameter widget of the given pool kind."""
+        frame = self.config_frame
+        if kind == 'label':
+            return ttk.Label(frame)
+        if kind == 'desc':
+            return ttk.Label(frame, font=('Arial', 8), foreground='gray')
+        if kind == 'check':
+            return ttk.Checkbutton(frame)
+        if kind == 'str':
+            return ttk.Entry(frame, width=30)
+
+        # 'number': entry + slider in a frame; the slider is packed only when
+        # the parameter has a range
+        widget_frame = ttk.Frame(frame)
+        widget_frame.entry = ttk.Entry(widget_frame, width=10)
+        widget_frame.entry.pack(side='left', padx=(0, 5))
+        widget_frame.scale = ttk.Scale(widget_frame, orient='horizontal')
+        return widget_frame
+
+    def _show_param_widget(self, kind: str, row: int, column: int, sticky: str, **grid_opts):
+        """Take a widget from the pool (or create one) and grid it into the config frame."""
+        pool = self._widget_pools[kind]
+        widget = pool.pop() if pool else self._new_param_widget(kind)
+        widget.grid(row=row, column=column, sticky=sticky, **grid_opts)
+        widget.lift()  # Keep Tab focus order in row order for recycled widgets
+        self._shown_widgets.append((kind, widget))
+        return widget
+
+    def _release_param_widget(self, kind: str, widget):
+        """Hide a parameter widget and return it to its pool, unlinked from its variable."""
+        widget.grid_forget()
+
+        # Pooled widgets must not keep the old test's variables linked
+        if kind == 'number':
+            widget.entry.configure(textvariable='')
+            widget.scale.configure(variable='')
+        elif kind == 'check':
+            widget.configure(variable='')
+        elif kind == 'str':
+            widget.configure(textvariable='')
+
+        self._widget_pools[kind].append(widget)
+
     def _generate_param_widgets(self):
         """Generate parameter input widgets based on test definition."""
-        # Clear existing widgets
-        for widget in self.config_frame.winfo_children():
-            widget.destroy()
+        # Return shown widgets to their pools
+        for kind, widget in self._shown_widgets:
+            self._release_param_widget(kind, widget)
+        self._shown_widgets.clear()
         self.param_widgets.clear()
+        self._defaults = {}
+        self._config_mirror = {}
+        self._invalid_params.clear()
 
-        if not self.selected_test_id:
-            return
-
-        test = self.registry.get_test(self.selected_test_id)
-        if not test:
+        if not self._cached_test:
             return
 
-        params = test.get_parameters()
-
+        show = self._show_param_widget
         row = 0
-        for param_name, param_def in params.items():
+        for param_name, label_text, param_def in self._param_rows:
             # Label
-            label_text = param_name.replace('_', ' ').title()
-            if 'unit' in param_def:
-                label_text += f" ({param_def['unit']})"
-            ttk.Label(self.config_frame, text=label_text).grid(row=row, column=0, sticky='w', padx=5, pady=5)
+            show('label', row, 0, 'w', padx=5, pady=5).configure(text=label_text)
 
             # Input widget based on type
             param_type = param_def['type']
 
             if param_type in ['int', 'float']:
-                # Create slider + entry
-                widget_frame = ttk.Frame(self.config_frame)
-                widget_frame.grid(row=row, column=1, sticky='ew', padx=5, pady=5)
-
+                # Slider + entry
                 var = tk.DoubleVar(value=param_def['default']) if param_type == 'float' else tk.IntVar(value=param_def['default'])
 
-                # Entry
-                entry = ttk.Entry(widget_frame, textvariable=var, width=10)
-                entry.pack(side='left', padx=(0, 5))
+                widget_frame = show('number', row, 1, 'ew', padx=5, pady=5)
+                widget_frame.entry.configure(textvariable=var)
 
                 # Slider (if min/max defined)
+                scale = widget_frame.scale
                 if 'min' in param_def and 'max' in param_def:
-                    scale = ttk.Scale(widget_frame, from_=param_def['min'], to=param_def['max'],
-                                     variable=var, orient='horizontal')
+                    scale.configure(from_=param_def['min'], to=param_def['max'], variable=var)
                     scale.pack(side='left', fill='x', expand=True)
+                else:
+                    scale.pack_forget()
+                    scale.configure(variable='')
 
                 self.param_widgets[param_name] = var
 
             elif param_type == 'bool':
                 var = tk.BooleanVar(value=param_def.get('default', False))
-                checkbox = ttk.Checkbutton(self.config_frame, variable=var)
-                checkbox.grid(row=row, column=1, sticky='w', padx=5, pady=5)
+                show('check', row, 1, 'w', padx=5, pady=5).configure(variable=var)
                 self.param_widgets[param_name] = var
 
             elif param_type == 'str':
                 var = tk.StringVar(value=param_def.get('default', ''))
-                entry = ttk.Entry(self.config_frame, textvariable=var, width=30)
-                entry.grid(row=row, column=1, sticky='ew', padx=5, pady=5)
+                show('str', row, 1, 'ew', padx=5, pady=5).configure(textvariable=var)
                 self.param_widgets[param_name] = var
 
             # Description tooltip
             if 'description' in param_def:
-                desc_label = ttk.Label(self.config_frame, text=param_def['description'],
-                                      font=('Arial', 8), foreground='gray')
-                desc_label.grid(row=row, column=2, sticky='w', padx=5)
+                show('desc', row, 2, 'w', padx=5).configure(text=param_def['description'])
 
             row += 1
 
         self.config_frame.grid_columnconfigure(1, weight=1)
 
-        # Bind value changes to update duration
-        for var in self.param_widgets.values():
-            if isinstance(var, (tk.IntVar, tk.DoubleVar, tk.StringVar, tk.BooleanVar)):
-                var.trace_add('write', lambda *args: self._update_duration_estimate())
+        self._defaults = {name: var.get() for name, var in self.param_widgets.items()}
+        self._config_mirror = dict(self._defaults)
+
+        # Mirror value changes and update duration. The callback must not
+        # reference the variable: Tcl holds it, which would keep the variable
+        # (and its Tcl side) alive after the next selection replaces it.
+        for param_name, var in self.param_widgets.items():
+            var.trace_add('write', functools.partial(self._on_var_write, param_name))
+
+    def _on_var_write(self, param_name: str, *_trace_args):
+        """Variable trace: mirror the new value, then schedule a duration update."""
+        var = self.param_widgets.get(param_name)
+        if var is None:
+            return
+        try:
+            self._config_mirror[param_name] = var.get()
+            self._invalid_params.discard(param_name)
+        except tk.TclError:
+            self._invalid_params.add(param_name)  # e.g. an emptied numeric entry
+        self._schedule_duration_update()
+
+    def _schedule_duration_update(self):
+        """Update the duration estimate once edits pause (slider drags write many values)."""
+        if self._bulk_update:
+            return
+        if self._dur_after:
+            self.after_cancel(self._dur_after)
+        self._dur_after = self.after(150, self._update_duration_estimate)
 
     def _update_duration_estimate(self):
         """Update estimated duration label."""
-        if not self.selected_test_id:
-            return
+        self._dur_after = None
 
-        test = self.registry.get_test(self.selected_test_id)
+        test = self._cached_test
         if not test:
             return
 
         try:
             config = self._get_config()
+
+            # Skip the estimate if nothing changed since the last one
+            key = (self.selected_test_id, tuple(config.items()))
+            if key == self._last_dur_key:
+                return
+            self._last_dur_key = key
+
             duration_sec = test.estimate_duration(config)
 
             if duration_sec < 60:
@@ -255,29 +409,36 @@ class TestLibraryTab(ttk.Frame):
                 duration_str = f"{duration_sec/3600:.1f} hours"
 
             self.duration_label.config(text=f"Estimated duration: {duration_str}")
-        except:
+        except (KeyError, ValueError, TypeError) as e:
+            logger.debug("Duration estimate for %s failed: %r", self.selected_test_id, e)
+            self._last_dur_key = None
             self.duration_label.config(text="Estimated duration: --")
 
     def _get_config(self) -> Dict[str, Any]:
-        """Get current configuration from widgets."""
-        config = {}
-        for param_name, var in self.param_widgets.items():
-            config[param_name] = var.get()
-        return config
+        """
+        Get current configuration from widgets.
+
+        Returns:
+            Copy of the parameter values mirrored from the widget variables
+            (ValueError if a parameter entry does not hold a valid value)
+        """
+        if self._invalid_params:
+            raise ValueError(f"Invalid value for: {', '.join(sorted(self._invalid_params))}")
+        return self._config_mirror.copy()
 
     def _reset_params(self):
         """Reset parameters to defaults."""
-        if not self.selected_test_id:
-            return
-
-        test = self.registry.get_test(self.selected_test_id)
-        if not test:
-            return
-
-        params = test.get_parameters()
-        for param_name, param_def in params.items():
-            if param_name in self.param_widgets:
-                self.param_widgets[param_name].set(param_def['default'])
+        self._bulk_update = True
+        try:
+            for param_name, value in self._defaults.items():
+                self.param_widgets[param_name].set(value)
+        finally:
+            self._bulk_update = False
+
+        # One estimate for the whole reset
+        if self._dur_after:
+            self.after_cancel(self._dur_after)
+        self._update_duration_estimate()
 
     def _run_test(self):
         """Run selected test."""
@@ -285,23 +446,26 @@ class TestLibraryTab(ttk.Frame):
             messagebox.showwarning("No Test Selected", "Please select a test from the list.")
             return
 
-        # Get test instance
-        test = self.registry.get_test(self.selected_test_id)
+        # Test instance cached on selection
+        test = self._cached_test
         if not test:
             messagebox.showerror("Error", "Failed to get test instance.")
             return
 
         # Get configuration
-        config = self._get_config()
+        try:
+            config = self._get_config()
+        except ValueError as e:
+            messagebox.showerror("Invalid Configuration", f"Configuration error:\n{e}")
+            return
 
-        # Validate configuration
-        valid, error = test.validate_config(config)
+        # Validate configuration and estimate duration
+        valid, error, duration_sec = test.prepare(config)
         if not valid:
             messagebox.showerror("Invalid Configuration", f"Configuration error:\n{error}")
             return
 
         # Confirm long tests
-        duration_sec = test.estimate_duration(config)
         if duration_sec > 3600:  # > 1 hour
             hours = duration_sec / 3600
             if not messagebox.askyesno("Long Test",
@@ -320,59 +484,97 @@ class TestLibraryTab(ttk.Frame):
         # Store current test
         self.current_test = test
 
-        # Run in background thread
+        # Run in background thread; the outcome is handled by _drain_progress()
         def run_thread():
             try:
                 results = test.run(config, progress_callback=self._progress_callback)
-                self.after(0, lambda: self._test_completed(results))
+                self._outcome_q.put((self._test_completed, results))
             except Exception as e:
-                self.after(0, lambda: self._test_error(str(e)))
+                self._outcome_q.put((self._test_error, str(e)))
 
         self.test_thread = threading.Thread(target=run_thread, daemon=True)
         self.test_thread.start()
 
     def _progress_callback(self, progress: float, message: str):
-        """Progress callback from test."""
-        def update():
-            self.progress_bar['value'] = max(0, min(100, progress))
-            self.progress_label.config(text=message)
-            self.results_text.insert('end', f"{message}\n")
-            self.results_text.see('end')
+        """Progress callback from test (runs on the test thread; no Tk calls)."""
+        self._progress_q.put((progress, message))
+
+    def _apply_progress(self):
+        """Apply queued progress: the latest value and all messages in one insert."""
+        assert threading.current_thread() is threading.main_thread(), "Tk call off the main thread"
+
+        messages = []
+        progress = None
+        try:
+            while True:
+                progress, message = self._progress_q.get_nowait()
+                messages.append(message)
+        except queue.Empty:
+            pass
+
+        if not messages:
+            return
+
+        self.progress_bar['value'] = max(0, min(100, progress))
+        self.progress_label.config(text=messages[-1])
+        results_text = self.results_text
+        results_text.insert('end', '\n'.join(messages) + '\n')
+
+        # Bound the widget for long-running tests
+        n_lines = int(results_text.index('end-1c').split('.')[0])
+        if n_lines > _MAX_RESULT_LINES:
+            results_text.delete('1.0', f'{_TRIM_RESULT_LINES + 1}.0')
+
+        results_text.see('end')
+
+        # Redraw now rather than whenever the loop next goes idle
+        results_text.update_idletasks()
 
-        self.after(0, update)
+    def _drain_progress(self):
+        """Apply queued progress updates and the test outcome (20 Hz)."""
+        # Reschedule first: the error handler blocks in a message box
+        self._drain_after_id = self.after(50, self._drain_progress)
+
+        self._apply_progress()
+
+        try:
+            handler, arg = self._outcome_q.get_nowait()
+        except queue.Empty:
+            return
+        handler(arg)
 
     def _test_completed(self, results: dict):
         """Handle test completion."""
+        self._apply_progress()  # Show the last progress lines before the results
         self.run_button.config(state='normal')
         self.stop_button.config(state='disabled')
         self.pause_button.config(state='disabled')
         self.progress_bar['value'] = 100
         self.progress_label.config(text="Test completed")
 
-        # Display results
-        self.results_text.insert('end', "\n" + "="*50 + "\n")
-        self.results_text.insert('end', "TEST RESULTS\n")
-        self.results_text.insert('end', "="*50 + "\n\n")
+        # Display results, built as one string for a single insert
+        lines = ["", "="*50, "TEST RESULTS", "="*50, ""]
 
         if 'error' in results:
-            self.results_text.insert('end', f"ERROR: {results['error']}\n")
+            lines.append(f"ERROR: {results['error']}")
         elif 'summary' in results:
-            self.results_text.insert('end', "Summary:\n")
+            lines.append("Summary:")
             for key, value in results['summary'].items():
                 if isinstance(value, dict):
-                    self.results_text.insert('end', f"  {key}:\n")
-                    for k, v in value.items():
-                        self.results_text.insert('end', f"    {k}: {v}\n")
+                    lines.append(f"  {key}:")
+                    lines.extend(f"    {k}: {v}" for k, v in value.items())
                 else:
-                    self.results_text.insert('end', f"  {key}: {value}\n")
+                    lines.append(f"  {key}: {value}")
 
         if 'log_file' in results:
-            self.results_text.insert('end', f"\nData logged to: {results['log_file']}\n")
+            lines.append(f"\nData logged to: {results['log_file']}")
 
+        self.results_text.insert('end', '\n'.join(lines) + '\n')
         self.results_text.see('end')
 
     def _test_error(self, error_msg: str):
         """Handle test error."""
+        self._apply_progress()
         self.run_button.config(state='normal')
         self.stop_button.config(state='disabled')
         self.pause_button.config(state='disabled')
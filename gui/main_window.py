@@ -32,6 +32,10 @@ class MainWindow(tk.Tk):
         hardware_interface = {'teensy': teensy, 'safety': safety_monitor}
         self.test_registry = TestRegistry(hardware_interface, data_logger)
 
+        # Last values shown in the status bar (see _update_status_bar)
+        self._last_motor_sig = None
+        self._last_sensor_sig = None
+
         self.title("Test Bench Control - Tendon-Driven Hand")
         self.geometry("1400x900")
 
@@ -87,6 +91,9 @@ class MainWindow(tk.Tk):
         self.status_bar = SafetyStatusBar(self)
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
 
+        # Tabs without live sensor displays; the status bar refreshes slowly there
+        self._slow_status_tabs = {str(self.review_tab), str(self.calibration_tab)}
+
     def _setup_safety_callbacks(self):
         """Setup safety violation callbacks."""
         self.safety.register_violation_callback(self._on_safety_violation)
@@ -108,23 +115,32 @@ class MainWindow(tk.Tk):
     def _update_status_bar(self):
         """Update status bar with current motor and safety status."""
         # Update motor status
-        self.status_bar.update_motor_status(
-            connected=self.teensy.connected,
-            enabled=self.manual_tab.motor_enabled if hasattr(self.manual_tab, 'motor_enabled') else False
-        )
-
-        # Update safety status if connected
-        if self.teensy.connected:
+        connected = self.teensy.connected
+        enabled = self.manual_tab.motor_enabled if hasattr(self.manual_tab, 'motor_enabled') else False
+        motor_sig = (connected, enabled)
+        if motor_sig != self._last_motor_sig:
+            self._last_motor_sig = motor_sig
+            self._last_sensor_sig = None  # The motor status resets the indicator
+            self.status_bar.update_motor_status(connected=connected, enabled=enabled)
+
+        # Update safety status if connected and the readings or limits changed
+        if connected:
             try:
                 sensor_data = self.teensy.get_sensors()
                 if sensor_data:
-                    safety_status = self.safety.get_safety_status(sensor_data)
-                    self.status_bar.update_safety_status(safety_status)
+                    sensor_sig = (sensor_data.get('current'), sensor_data.get('force_tendon'),
+                                  sensor_data.get('force_tip'), sensor_data.get('position'),
+                                  tuple(self.safety.limits.values()))
+                    if sensor_sig != self._last_sensor_sig:
+                        self._last_sensor_sig = sensor_sig
+                        safety_status = self.safety.get_safety_status(sensor_data)
+                        self.status_bar.update_safety_status(safety_status)
             except Exception as e:
                 pass  # Silently handle errors in status updates
 
-        # Schedule next update
-        self.after(100, self._update_status_bar)  # 10 Hz
+        # Schedule next update: 10 Hz, 2 Hz on tabs without live sensor displays
+        delay = 500 if str(self.notebook.select()) in self._slow_status_tabs else 100
+        self.after(delay, self._update_status_bar)
 
     def _start_status_update(self):
         """Start status bar update loop."""
@@ -134,7 +150,10 @@ class MainWindow(tk.Tk):
         """Handle window close event."""
         # Stop monitoring and disconnect
         self.safety.stop_monitoring()
-        self.logger.stop_logging()
+        try:
+            self.logger.stop_logging()
+        except Exception as e:
+            print(f"Error writing log file: {e}")  # Still close the window
         self.teensy.disconnect()
 
         # Destroy window
@@ -6,7 +6,15 @@ All platform-specific controllers must inherit from this class.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Callable
+from collections import namedtuple
+from typing import Optional, Dict, Callable, List
+
+# Keys of the get_sensors() dict, in the order fill_sensors() writes them
+SENSOR_FIELDS = ('timestamp', 'position', 'velocity', 'current',
+                 'force_tendon', 'force_tip', 'angle_joint')
+
+# One sensor reading with SENSOR_FIELDS as attributes (see read_frame)
+SensorFrame = namedtuple('SensorFrame', SENSOR_FIELDS)
 
 
 class HardwareController(ABC):
@@ -93,6 +101,54 @@ class HardwareController(ABC):
         """
         pass
 
+    def fill_sensors(self, out: List, offset: int = 0) -> bool:
+        """
+        Read all sensors into an existing list instead of a new dict.
+
+        Args:
+            out: List receiving the SENSOR_FIELDS values at out[offset:offset + 7]
+            offset: Index of the first value in out
+
+        Returns:
+            True if successful, False if read failed (out is left unchanged)
+        """
+        data = self.get_sensors()
+        if not data:
+            return False
+        for i, key in enumerate(SENSOR_FIELDS, offset):
+            out[i] = data[key]
+        return True
+
+    def read_frame(self) -> Optional[SensorFrame]:
+        """
+        Read all sensors as a SensorFrame tuple instead of a dict.
+
+        Returns:
+            SensorFrame (same values and units as get_sensors()),
+            or None if read failed
+        """
+        data = self.get_sensors()
+        if not data:
+            return None
+        return SensorFrame._make(data[key] for key in SENSOR_FIELDS)
+
+    def sample_and_move(self, position: int) -> Optional[Dict]:
+        """
+        Read all sensors, then set a new target position.
+
+        Platforms with a request/response link can override this to send
+        both commands in one transfer.
+
+        Args:
+            position: Target position (encoder counts) set after sampling
+
+        Returns:
+            Sensor dict as returned by get_sensors(), or None if read failed
+        """
+        data = self.get_sensors()
+        self.set_position(position)
+        return data
+
     @abstractmethod
     def start_streaming(self, rate_hz: int, callback: Callable) -> bool:
         """
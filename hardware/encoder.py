@@ -64,12 +64,13 @@ class EncoderReader:
         self.calibration_file.parent.mkdir(parents=True, exist_ok=True)
 
         from datetime import datetime
+        self.calibration_date = datetime.now().isoformat()
 
         data = {
             'sensor_id': self.sensor_id,
             'zero_position': self.zero_position,
             'counts_per_revolution': self.counts_per_revolution,
-            'calibration_date': datetime.now().isoformat()
+            'calibration_date': self.calibration_date
         }
 
         with open(self.calibration_file, 'w') as f:
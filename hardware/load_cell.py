@@ -18,15 +18,19 @@ class LoadCellReader:
     Teensy reports raw values which are converted here.
     """
 
-    def __init__(self, sensor_id: str, calibration_file: Optional[Path] = None):
+    def __init__(self, sensor_id: str, calibration_file: Optional[Path] = None,
+                 data_key: Optional[str] = None):
         """
         Initialize load cell reader.
 
         Args:
             sensor_id: Unique identifier (e.g., "load_cell_tendon")
             calibration_file: Path to calibration data file
+            data_key: Key of this load cell's raw value in controller sensor
+                dicts (e.g., "force_tendon")
         """
         self.sensor_id = sensor_id
+        self.data_key = data_key
         self.calibration_file = calibration_file or Path(f"data/calibrations/{sensor_id}.json")
 
         # Calibration parameters
@@ -67,12 +71,13 @@ class LoadCellReader:
         self.calibration_file.parent.mkdir(parents=True, exist_ok=True)
 
         from datetime import datetime
+        self.calibration_date = datetime.now().isoformat()
 
         data = {
             'sensor_id': self.sensor_id,
             'zero_offset': self.zero_offset,
             'calibration_factor': self.calibration_factor,
-            'calibration_date': datetime.now().isoformat(),
+            'calibration_date': self.calibration_date,
             'calibration_weight_kg': self.calibration_weight_kg
         }
 
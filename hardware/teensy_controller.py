@@ -7,9 +7,13 @@ Handles serial communication with Teensy microcontroller for motor control.
 import serial
 import time
 import threading
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, List, Tuple
 from . import protocol as proto
-from .base_controller import HardwareController
+from .base_controller import HardwareController, SensorFrame
+
+# Pre-encoded command lines for calls made on every cycle/poll step
+_GETSENSORS_LINE = (proto.CMD_GETSENSORS + proto.LINE_TERMINATOR).encode('utf-8')
+_SETPOS_LINE = (proto.CMD_SETPOS + " %d" + proto.LINE_TERMINATOR).encode('utf-8')
 
 
 class TeensyController(HardwareController):
@@ -42,6 +46,9 @@ class TeensyController(HardwareController):
             )
             time.sleep(0.5)  # Wait for connection to stabilize
 
+            # Deliver each response line as soon as it arrives (Linux)
+            self.set_low_latency(True)
+
             # Verify connection with PING
             response = self.ping()
             if response == "PONG":
@@ -55,6 +62,31 @@ class TeensyController(HardwareController):
             print(f"Serial connection error: {e}")
             return False
 
+    def set_low_latency(self, enabled: bool = True) -> bool:
+        """
+        Set the serial driver's ASYNC_LOW_LATENCY flag.
+
+        Without it, USB-serial drivers (e.g. FTDI) may hold received bytes
+        for up to 16 ms before handing them to the reader. Only supported
+        on Linux; a no-op elsewhere.
+
+        Args:
+            enabled: True to enable low latency mode, False to clear it
+
+        Returns:
+            True if the flag was updated
+        """
+        if not self.serial_port or not hasattr(self.serial_port, 'set_low_latency_mode'):
+            return False
+
+        try:
+            self.serial_port.set_low_latency_mode(enabled)
+            return True
+        except (ValueError, OSError) as e:
+            # e.g. drivers without TIOCSSERIAL support
+            print(f"Could not set serial low latency mode: {e}")
+            return False
+
     def disconnect(self):
         """Disconnect from Teensy."""
         self.stop_streaming()
@@ -72,6 +104,23 @@ class TeensyController(HardwareController):
         Returns:
             Response string (without terminator)
         """
+        cmd_bytes = (command + proto.LINE_TERMINATOR).encode('utf-8')
+        return self._exchange(cmd_bytes, 1)[0]
+
+    def _exchange(self, payload: bytes, num_responses: int) -> List[str]:
+        """
+        Write encoded command line(s) and read the given number of response lines.
+
+        The firmware handles commands line by line, so several commands can be
+        pipelined in one write to save USB round-trips.
+
+        Args:
+            payload: Encoded command line(s), terminators included
+            num_responses: Number of response lines to read
+
+        Returns:
+            List of response strings (without terminators)
+        """
         if not self.connected or not self.serial_port:
             raise RuntimeError("Not connected to Teensy")
 
@@ -79,13 +128,10 @@ class TeensyController(HardwareController):
             # Clear input buffer
             self.serial_port.reset_input_buffer()
 
-            # Send command
-            cmd_bytes = (command + proto.LINE_TERMINATOR).encode('utf-8')
-            self.serial_port.write(cmd_bytes)
+            self.serial_port.write(payload)
 
-            # Read response
-            response = self.serial_port.readline().decode('utf-8').strip()
-            return response
+            return [self.serial_port.readline().decode('utf-8').strip()
+                    for _ in range(num_responses)]
 
     def _parse_response(self, response: str) -> Tuple[str, str]:
         """
@@ -132,8 +178,7 @@ class TeensyController(HardwareController):
 
     def set_position(self, position: int) -> bool:
         """Set target position (encoder counts)."""
-        command = f"{proto.CMD_SETPOS} {position}"
-        response = self._send_command(command)
+        response = self._exchange(_SETPOS_LINE % position, 1)[0]
         resp_type, data = self._parse_response(response)
         if resp_type == proto.RESP_NACK and data == proto.ERR_LIMIT:
             raise ValueError("Position would exceed safety limits")
@@ -194,7 +239,60 @@ class TeensyController(HardwareController):
             Dict with keys: timestamp, position, velocity, current,
                            force_tendon, force_tip, angle_joint
         """
-        response = self._send_command(proto.CMD_GETSENSORS)
+        response = self._exchange(_GETSENSORS_LINE, 1)[0]
+        return self._parse_sensors(response)
+
+    def fill_sensors(self, out: List, offset: int = 0) -> bool:
+        """
+        Read all sensors into an existing list (see HardwareController.fill_sensors).
+
+        Returns:
+            True if successful
+        """
+        response = self._exchange(_GETSENSORS_LINE, 1)[0]
+        resp_type, data = self._parse_response(response)
+
+        if resp_type == proto.RESP_DATA:
+            values = data.split()
+            if len(values) >= 7:
+                out[offset:offset + 7] = map(int, values[:7])
+                return True
+        return False
+
+    def read_frame(self) -> Optional[SensorFrame]:
+        """
+        Read all sensors as a SensorFrame (see HardwareController.read_frame).
+
+        Returns:
+            SensorFrame, or None if read failed
+        """
+        response = self._exchange(_GETSENSORS_LINE, 1)[0]
+        resp_type, data = self._parse_response(response)
+
+        if resp_type == proto.RESP_DATA:
+            values = data.split()
+            if len(values) >= 7:
+                return SensorFrame._make(map(int, values[:7]))
+        return None
+
+    def sample_and_move(self, position: int) -> Optional[Dict]:
+        """
+        Read all sensors, then set a new target position, in one transfer.
+
+        Args:
+            position: Target position (encoder counts) set after sampling
+
+        Returns:
+            Sensor dict as returned by get_sensors(), or None if read failed
+        """
+        sensors, response = self._exchange(_GETSENSORS_LINE + _SETPOS_LINE % position, 2)
+        resp_type, data = self._parse_response(response)
+        if resp_type == proto.RESP_NACK and data == proto.ERR_LIMIT:
+            raise ValueError("Position would exceed safety limits")
+        return self._parse_sensors(sensors)
+
+    def _parse_sensors(self, response: str) -> Optional[Dict]:
+        """Parse a 'DATA ...' sensor response into a sensor dict."""
         resp_type, data = self._parse_response(response)
 
         if resp_type == proto.RESP_DATA:
@@ -5,7 +5,7 @@ Abstract base class for all automated test modules.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Callable, Optional
+from typing import Dict, Any, Callable, Optional, Tuple
 import time
 
 
@@ -110,6 +110,24 @@ class BaseTest(ABC):
         """
         pass
 
+    def prepare(self, config: Dict) -> Tuple[bool, str, float]:
+        """
+        Validate configuration and estimate duration in one call.
+
+        Override to share work between validation and the estimate.
+
+        Args:
+            config: Configuration dictionary
+
+        Returns:
+            (is_valid, error_message, estimated_seconds) tuple; the estimate
+            is 0.0 if the configuration is invalid
+        """
+        valid, error = self.validate_config(config)
+        if not valid:
+            return False, error, 0.0
+        return True, "", self.estimate_duration(config)
+
     @abstractmethod
     def run(self, config: Dict, progress_callback: Optional[Callable] = None) -> Dict:
         """
@@ -1,7 +1,34 @@
 """Unit tests for data management."""
+import json
+import os
+
 import pytest
+from data import _json
 from data.config_manager import ConfigManager
-from data.logger import DataLogger
+from data.logger import DataLogger, _write_all
+from data.session import (Session, SessionManager, new_session_csv_path,
+                          _dirty_sessions, _save_dirty_sessions)
+
+
+class TestJson:
+    """Test JSON backend consistency."""
+
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    def test_non_finite_floats_written_as_null(self, monkeypatch, use_orjson):
+        """Test NaN/Infinity serialize to null with either backend."""
+        if use_orjson and not _json.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(_json, 'HAS_ORJSON', use_orjson)
+
+        data = {'force': float('nan'), 'limits': [1.5, float('inf')], 'n': 2}
+        assert json.loads(_json.dumps(data, indent=None)) == {
+            'force': None, 'limits': [1.5, None], 'n': 2}
+
+    def test_loads_nan_tokens(self):
+        """Test documents with NaN tokens (written by the json module) still load."""
+        data = _json.loads(b'{"force": NaN, "n": 2}')
+        assert data['force'] != data['force']
+        assert data['n'] == 2
 
 
 class TestConfigManager:
@@ -17,6 +44,38 @@ class TestConfigManager:
         assert 'hardware' in config_manager.config
         assert 'platform' in config_manager.config['hardware']
 
+    def test_get_after_set(self, config_manager):
+        """Test get() reflects set() on leaves and subtrees."""
+        config_manager.set('hardware', 'teensy', value={'port': 'COM3'})
+        assert config_manager.get('hardware', 'teensy', 'port') == 'COM3'
+        assert config_manager.get('hardware', 'teensy', 'baudrate') is None
+
+        config_manager.set('custom', 'nested', 'key', value=1)
+        assert config_manager.get('custom') == {'nested': {'key': 1}}
+
+        config_manager.set_pid_params({'kd': 0.5})
+        assert config_manager.get('pid', 'kd') == 0.5
+
+    def test_get_sees_section_edits(self, config_manager):
+        """Test get() reflects edits made through returned sections."""
+        config_manager.get_pid_params()['kp'] = 5.0
+        assert config_manager.get('pid', 'kp') == 5.0
+
+        config_manager.config['motion_profile']['max_velocity'] = 250
+        assert config_manager.get('motion_profile', 'max_velocity') == 250
+
+        config_manager.get('hardware')['extra'] = {'depth': 2}
+        assert config_manager.get('hardware', 'extra', 'depth') == 2
+
+    def test_save_and_load(self, config_manager):
+        """Test config round-trips through the config file."""
+        config_manager.set('pid', 'kp', value=2.5)
+        config_manager.save()
+
+        reloaded = ConfigManager(config_file=config_manager.config_file)
+        assert reloaded.get('pid', 'kp') == 2.5
+        assert reloaded.get('hardware', 'platform') == 'teensy'
+
 
 class TestDataLogger:
     """Test data logger."""
@@ -40,8 +99,163 @@ class TestDataLogger:
         data_logger.buffer.append(data_point)
         assert len(data_logger.buffer) == 1
 
+    def test_log_to_csv(self, data_logger, tmp_path):
+        """Test logged samples are written to CSV in header order."""
+        csv_path = tmp_path / "log.csv"
+        data_logger.start_logging(csv_path, ['position', 'force'])
+        data_logger.log({'position': 100, 'force': 1.5})
+        data_logger.log({'position': 200, 'force': 'a,b'})
+        data_logger.stop_logging()
+
+        lines = csv_path.read_text().splitlines()
+        assert lines == ['position,force', '100,1.5', '200,"a,b"']
+
+    def test_log_row(self, data_logger, tmp_path):
+        """Test logging pre-ordered rows."""
+        csv_path = tmp_path / "rows.csv"
+        data_logger.start_logging(csv_path, ('cycle', 'position'))
+        data_logger.log_row((0, 100))
+        data_logger.log_row((1, 5000))
+        data_logger.stop_logging()
+
+        assert csv_path.read_text().splitlines() == ['cycle,position', '0,100', '1,5000']
+        assert data_logger.get_recent_data(1) == [{'cycle': 1, 'position': 5000}]
+
+    def test_row_format(self, data_logger, tmp_path):
+        """Test fixed-format rows, falling back for values the format rejects."""
+        csv_path = tmp_path / "fmt.csv"
+        data_logger.start_logging(csv_path, ('cycle', 'position'), row_format=b"%d,%d\r\n")
+        data_logger.log_row((0, 100))
+        data_logger.log_row((1, None))
+        data_logger.log_row((2, 100.75))
+        data_logger.stop_logging()
+
+        assert csv_path.read_text().splitlines() == ['cycle,position', '0,100', '1,', '2,100.75']
+
+    def test_sessions_use_separate_queues(self, data_logger, tmp_path):
+        """Test a row queued for a stopped session never reaches the next file."""
+        data_logger.start_logging(tmp_path / "a.csv", ('n',))
+        old_q = data_logger._q
+        data_logger.stop_logging()
+        old_q.put((99,))  # A log() call that raced stop_logging()
+
+        data_logger.start_logging(tmp_path / "b.csv", ('n',))
+        data_logger.log_row((1,))
+        data_logger.stop_logging()
+        data_logger.log_row((2,))  # Rejected once stopped
+
+        assert (tmp_path / "b.csv").read_text().splitlines() == ['n', '1']
+
+    def test_writer_error_raised_on_stop(self, data_logger, tmp_path):
+        """Test a failed CSV write is re-raised by stop_logging."""
+        def fail(batch):
+            raise OSError("disk full")
+
+        data_logger._write_batch = fail
+        data_logger.start_logging(tmp_path / "err.csv", ('n',))
+        data_logger.log_row((1,))
+        with pytest.raises(OSError, match="disk full"):
+            data_logger.stop_logging()
+        assert not data_logger.is_logging
+
+    @pytest.mark.skipif(not hasattr(os, 'writev'), reason="no writev()")
+    def test_short_gathered_write(self, monkeypatch, tmp_path):
+        """Test _write_all finishes a short writev() with the unwritten bytes."""
+        real_writev = os.writev
+        monkeypatch.setattr(os, 'writev', lambda fd, bufs: real_writev(fd, [bufs[0], bufs[1][:1]]))
+
+        path = tmp_path / "short.bin"
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT)
+        try:
+            _write_all(fd, [b'ab', b'cd', b'ef'])
+        finally:
+            os.close(fd)
+        assert path.read_bytes() == b'abcdef'
+
     def test_buffer_size(self):
         """Test logger buffer size."""
         logger = DataLogger(buffer_size=100)
         assert logger is not None
         assert logger.buffer.maxlen == 100
+
+
+class TestSession:
+    """Test session metadata persistence."""
+
+    def test_add_test_autosave(self, tmp_path):
+        """Test add_test writes session.json itself by default."""
+        session = Session('auto', base_dir=tmp_path)
+        session.create(platform='mock')
+        session.add_test('t1', 'hold', {})
+
+        metadata = json.loads((tmp_path / 'auto' / 'session.json').read_text())
+        assert [t['test_id'] for t in metadata['tests']] == ['t1']
+        assert not session.tests_file.exists()
+
+    def test_batched_add_test(self, tmp_path):
+        """Test deferred add_test writes are visible via the sidecar and persisted by flush."""
+        session = Session('batch', base_dir=tmp_path)
+        session.create(platform='mock')
+
+        for i in range(5):
+            session.add_test(f"t{i}", 'torque', {}, autosave=False)
+
+        reloaded = Session('batch', base_dir=tmp_path)
+        reloaded.load_metadata()
+        assert reloaded.get_test_count() == 5
+        assert reloaded not in _dirty_sessions
+
+        session.flush()
+        reloaded.load_metadata()
+        assert reloaded.get_test_count() == 5
+
+    def test_dirty_sessions_saved_at_exit(self, tmp_path):
+        """Test the exit hook saves only sessions with deferred tests."""
+        session = Session('exit', base_dir=tmp_path)
+        session.create(platform='mock')
+        session.add_test('t1', 'torque', {}, autosave=False)
+        assert session in _dirty_sessions
+
+        _save_dirty_sessions()
+        assert session not in _dirty_sessions
+        assert not session.tests_file.exists()
+
+
+class TestSessionCsvPath:
+    """Test timestamped log paths."""
+
+    def test_new_session_csv_path(self, tmp_path):
+        """Test the path is prefix_YYYYMMDD_HHMMSS.csv under base_dir."""
+        path = new_session_csv_path('cycle_test', tmp_path)
+        assert path.parent == tmp_path
+        assert path.suffix == '.csv'
+        prefix, date, clock = path.stem.rsplit('_', 2)
+        assert prefix == 'cycle_test'
+        assert len(date) == 8 and date.isdigit()
+        assert len(clock) == 6 and clock.isdigit()
+
+
+class TestSessionManager:
+    """Test session listing."""
+
+    def test_list_sessions_sees_updates(self, tmp_path):
+        """Test cached listings pick up changes to session.json."""
+        manager = SessionManager(base_dir=tmp_path)
+        session = manager.create_session(prefix='cache', platform='mock')
+        assert manager.list_sessions()[0]['num_tests'] == 0
+
+        session.add_test('t1', 'hold', {})
+        sessions = manager.list_sessions()
+        assert sessions[0]['num_tests'] == 1
+        assert len(manager.find_sessions_by_test_type('hold')) == 1
+
+        manager.delete_session(session.session_id)
+        assert manager.list_sessions() == []
+
+    def test_list_sessions_skips_non_sessions(self, tmp_path):
+        """Test directories without session.json are not listed."""
+        manager = SessionManager(base_dir=tmp_path)
+        (tmp_path / 'empty').mkdir()
+        (tmp_path / 'foreign' / 'data').mkdir(parents=True)
+        assert manager.list_sessions() == []
+        assert manager.find_sessions_by_test_type('hold') == []
@@ -1,6 +1,11 @@
 """Unit tests for hardware controllers."""
+import numpy as np
 import pytest
+from gui.calibration_tab import CalibrationTab
 from hardware import create_controller, list_platforms
+from hardware.base_controller import SENSOR_FIELDS
+from hardware.encoder import EncoderReader
+from hardware.load_cell import LoadCellReader
 
 
 class TestHardwareFactory:
@@ -57,6 +62,28 @@ class TestMockController:
         data = mock_controller.get_sensors()
         assert data is not None
 
+    def test_sample_and_move(self, mock_controller):
+        """Test sampling sensors and setting the next target in one call."""
+        data = mock_controller.sample_and_move(1000)
+        assert data is not None
+        assert 'position' in data
+        assert mock_controller.target_position == 1000
+
+    def test_fill_sensors(self, mock_controller):
+        """Test reading sensors into a preallocated list."""
+        buf = [None] * 8
+        assert mock_controller.fill_sensors(buf, 1)
+        assert buf[0] is None
+        assert all(v is not None for v in buf[1:])
+
+    def test_read_frame(self, mock_controller):
+        """Test reading sensors as a SensorFrame tuple."""
+        frame = mock_controller.read_frame()
+        assert frame is not None
+        assert isinstance(frame.position, (int, float))
+        assert isinstance(frame.force_tip, (int, float))
+        assert frame._fields == SENSOR_FIELDS
+
     def test_platform_info(self, mock_controller):
         """Test getting platform information."""
         info = mock_controller.get_platform_info()
@@ -64,3 +91,36 @@ class TestMockController:
         assert 'version' in info
         assert 'communication' in info
         assert 'Mock' in info['platform']
+
+
+class TestSensorConversion:
+    """Test the calibration tab's vectorized sensor conversion."""
+
+    def test_convert_all_matches_sensors(self, tmp_path):
+        """Test _convert_all matches convert_to_force and convert_to_angle."""
+        tendon = LoadCellReader("tendon", tmp_path / "tendon.json")
+        tendon.zero(100)
+        tendon.calibrate(1100, 1.0)
+        tip = LoadCellReader("tip", tmp_path / "tip.json")
+        tip.zero(-20)
+        encoder = EncoderReader("joint", tmp_path / "joint.json")
+        encoder.set_zero(1000)
+
+        # Only the conversion state; no Tk widgets are needed
+        tab = CalibrationTab.__new__(CalibrationTab)
+        tab._param_rows = {"tendon": 0, "tip": 1, "joint": 2}
+        tab._sensor_params = np.empty((3, 2), dtype=np.float64)
+        for sensor in (tendon, tip, encoder):
+            tab._update_sensor_params(sensor)
+
+        # Encoder readings on both sides of the zero position exercise the wrap
+        raws = np.array([[100, 600, 1100, 2000],
+                         [-20, 0, 35, 400],
+                         [0, 999, 1000, 4095]])
+        expected = [[tendon.convert_to_force(r) for r in raws[0]],
+                    [tip.convert_to_force(r) for r in raws[1]],
+                    [encoder.convert_to_angle(r) for r in raws[2]]]
+        np.testing.assert_allclose(tab._convert_all(raws), expected)
+
+        # A single reading converts the same as a column of samples
+        np.testing.assert_allclose(tab._convert_all(raws[:, 1]), [row[1] for row in expected])
@@ -41,3 +41,23 @@ class TestProtocolRegistry:
             assert hasattr(test, 'run')
             assert hasattr(test, 'get_name')
             assert hasattr(test, 'get_parameters')
+
+
+class TestBaseTest:
+    """Test behavior shared by all test protocols."""
+
+    def test_prepare(self, mock_controller, data_logger):
+        """Test prepare validates and estimates in one call."""
+        safety = SafetyMonitor(mock_controller)
+        hardware = {'controller': mock_controller, 'safety': safety}
+        registry = TestRegistry(hardware, data_logger)
+        test = registry.get_test('torque_efficiency')
+
+        config = test.get_default_config()
+        assert test.prepare(config) == (True, "", test.estimate_duration(config))
+
+        config['steps'] = 1
+        valid, error, duration = test.prepare(config)
+        assert not valid
+        assert error == test.validate_config(config)[1]
+        assert duration == 0.0